@@ -0,0 +1,213 @@
+"""
+带保护的不动点迭代
+每一步只求一次 iter_func(x)，同时用它做停止判断和下一步的迭代值；
+根据相邻两步的步长之比 q = |x(k+1) - x(k)| / |x(k) - x(k-1)| 估计压缩因子，
+q 持续大于 1 + GROWTH_MARGIN 且步长超过初值的量级（发散）、正负交替且步长不变（振荡）、或按当前的收缩速度在最大迭代次数内到不了精度时提前停止，
+不必等到浮点数溢出，线性发散（如 x -> 2x）几步之内就能停下；离开不稳定不动点时步长虽然增大，但相对初值的量级仍然很小，不会被误判为发散
+迭代轨迹存放在 Trajectory 中：可以完整保存、只保留最近若干步，或者不保存
+作业 4（Works/Week4/Homework4.py）与实验 2（Experiments/Section2/fixPointFig.py）共用本模块：
+两边的脚本都在各自的目录下运行，用 importlib 按文件路径加载并注册为 FixedPoint，不修改 sys.path
+"""
+import math
+
+import numpy as np
+
+# 迭代状态，与 Homework4 中各方法的状态字符串一致
+CONVERGED = "收敛"
+NOT_CONVERGED = "无法达到精度要求"
+OVERFLOW = "溢出错误"
+ZERO_DIVISION = "除零错误"
+DIVERGED = "发散"
+OSCILLATING = "振荡"
+COMPLEX = "复数结果"
+INVALID = "非法值"
+
+GROWTH_MARGIN = 0.05  # 压缩因子估计 q 超过 1 + GROWTH_MARGIN 才算步长在增大，q 略大于 1 时交给最大迭代次数处理
+
+
+class Trajectory:
+    """
+    迭代轨迹，每一行为 (x(k), iter_func(x(k)))，保存在 NumPy 数组中
+    - "full": 完整保存，缓冲区满了按 2 倍扩容，追加的均摊代价为 O(1)
+    - "ring": 环形缓冲区，只保留最近 capacity 步，内存固定
+    - "none": 不保存，只记录步数
+    """
+
+    def __init__(self, mode: str = "full", capacity: int = 64, dtype=np.float64) -> None:
+        """
+        :param mode: "full" / "ring" / "none"
+        :param capacity: "full" 的初始容量，"ring" 保留的步数
+        :param dtype: 数据类型，复数迭代时为 complex128
+        """
+        if mode not in ("full", "ring", "none"):
+            raise ValueError(f"未知的轨迹存储方式：{mode}")
+        if mode == "ring" and capacity < 1:  # 环形缓冲区至少要保留一步
+            raise ValueError(f"环形缓冲区的容量必须为正整数：{capacity}")
+        self.mode = mode
+        self.count = 0  # 一共追加过的步数
+        self.buffer = np.empty((0 if mode == "none" else capacity, 2), dtype=dtype)
+
+    def append(self, x, fx) -> None:
+        """
+        :param x: 迭代值 x(k)
+        :param fx: iter_func(x(k))，求值失败时为 nan
+        """
+        if self.mode == "full":
+            if self.count == len(self.buffer):
+                self.buffer = np.resize(self.buffer, (max(1, 2 * len(self.buffer)), 2))
+            self.buffer[self.count] = x, fx
+        elif self.mode == "ring":
+            self.buffer[self.count % len(self.buffer)] = x, fx
+        self.count += 1
+
+    def __len__(self) -> int:
+        return min(self.count, len(self.buffer))
+
+    @property
+    def points(self) -> np.ndarray:
+        """
+        按时间顺序排列的 (x, iter_func(x))，形状为 (len, 2)；
+        "full" 和未写满的 "ring" 返回缓冲区的视图，不复制
+        """
+        if self.mode == "ring" and self.count > len(self.buffer):
+            return np.roll(self.buffer, -(self.count % len(self.buffer)), axis=0)
+        return self.buffer[: len(self)]
+
+    @property
+    def iterations(self) -> np.ndarray:
+        """
+        points 每一行对应的迭代次数
+        """
+        return np.arange(self.count - len(self), self.count)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.points[:, 0]
+
+    @property
+    def fx(self) -> np.ndarray:
+        return self.points[:, 1]
+
+
+def quiet(*args, **kwargs) -> None:
+    """
+    不打印任何内容
+    """
+
+
+def fixed_point(
+    iter_func: callable,
+    x,
+    tol: float = 1e-5,
+    max_iter_count: int = 1000,
+    patience: int = 3,
+    guard: bool = True,
+    trajectory: str = "full",
+    capacity: int = 64,
+    log: callable = quiet,
+) -> dict:
+    """
+    不动点迭代 x(k+1) = iter_func(x(k))，|x(k) - iter_func(x(k))| <= tol 时停在 x(k)
+    :param iter_func: 迭代函数
+    :param x: 初值
+    :param tol: 停止条件
+    :param max_iter_count: 最大迭代次数，无论是否开启 guard 都不会超过
+    :param patience: 连续多少步出现发散 / 振荡 / 收敛太慢的迹象才停止，避免把开头几步的波动误判为发散
+    :param guard: 是否开启发散、振荡、收敛太慢的提前停止
+    :param trajectory: 轨迹的存储方式，见 Trajectory
+    :param capacity: 轨迹缓冲区的初始容量（"ring" 时为保留的步数）
+    :param log: 输出迭代过程的函数，默认不输出
+
+    :return: {
+        "x": 最后的迭代值,
+        "fx": iter_func(x)，求值失败时为 nan,
+        "iterations": 迭代次数,
+        "evaluations": iter_func 的求值次数,
+        "status": 状态，见本模块开头的常量,
+        "contraction": 最近一步的压缩因子估计 q,
+        "remaining": 按 q 估计还需要的迭代次数，q >= 1 时为 None,
+        "error_bound": 误差估计 q / (1 - q) * |x(k+1) - x(k)|，q >= 1 时为 None,
+        "trajectory": 迭代轨迹 Trajectory，每一步为 (x(k), iter_func(x(k)))；最后一步求值失败时 iter_func(x(k)) 为 nan,
+    }
+    """
+    real = not isinstance(x, complex)
+    iter_count = 0
+    evaluations = 0
+    trajectory = Trajectory(trajectory, capacity, np.float64 if real else np.complex128)
+    status = NOT_CONVERGED
+    q = None
+    remaining = None
+    error_bound = None
+    last_step = None  # 上一步的 x(k) - x(k-1)
+    growing = oscillating = slow = 0  # 连续出现对应迹象的步数
+    scale = max(1.0, abs(x))  # 初值的量级，判断发散时步长与它比较
+
+    while True:
+        failure = None  # 求值失败的原因
+        try:
+            gx = iter_func(x)
+        except OverflowError:
+            failure = OVERFLOW
+        except ZeroDivisionError:
+            failure = ZERO_DIVISION
+        else:
+            evaluations += 1
+            if real and isinstance(gx, complex):  # 实数迭代中出现复数（例如对负数开分数次方）
+                failure = COMPLEX
+            elif gx != gx:  # nan
+                failure = INVALID
+            elif math.isinf(abs(gx)):
+                failure = OVERFLOW
+        if failure is not None:
+            status = failure
+            fx = math.nan
+            trajectory.append(x, math.nan)
+            break
+        fx = gx
+        trajectory.append(x, gx)
+
+        step = gx - x
+        if abs(step) <= tol:
+            status = CONVERGED
+            break
+        if iter_count >= max_iter_count:  # 防止不收敛时无限迭代
+            break
+
+        if last_step is not None and last_step != 0:
+            q = abs(step) / abs(last_step)
+            if q < 1:
+                remaining = math.ceil(math.log(tol / abs(step)) / math.log(q))
+                error_bound = q / (1 - q) * abs(step)
+            else:
+                remaining = error_bound = None
+
+            if guard:
+                alternating = real and step * last_step < 0
+                growing = growing + 1 if q > 1 + GROWTH_MARGIN and abs(step) > scale else 0
+                oscillating = oscillating + 1 if alternating and abs(q - 1) < 1e-2 else 0
+                slow = slow + 1 if remaining is not None and iter_count + remaining > max_iter_count else 0
+                if growing >= patience:
+                    status = DIVERGED
+                    break
+                if oscillating >= patience:
+                    status = OSCILLATING
+                    break
+                if slow >= patience:  # 按目前的收缩速度在最大迭代次数内到不了精度
+                    break
+
+        x = gx
+        last_step = step
+        iter_count += 1
+        log(f"进行 {iter_count} 次迭代，此时的 x 为 {x}")
+
+    return {
+        "x": x,
+        "fx": fx,
+        "iterations": iter_count,
+        "evaluations": evaluations,
+        "status": status,
+        "contraction": q,
+        "remaining": remaining,
+        "error_bound": error_bound,
+        "trajectory": trajectory,
+    }
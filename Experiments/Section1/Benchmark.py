@@ -0,0 +1,176 @@
+"""
+Section1 多项式求值算法的基准测试
+对 f(x) = 1 + 2x + ... + (d + 1) x^d 扫描次数 d、自变量类型与求值策略，
+每个组合先预热再用 perf_counter 重复计时，输出中位数与离散程度，结果为 CSV / JSON，
+便于在不同提交之间对比是否出现性能回退
+
+用法：python Benchmark.py --degrees 1000 10000 --format json --output bench.json
+"""
+import argparse
+import csv
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from fractions import Fraction
+
+from Normal import naive
+from QinJiushao import horner
+from Estrin import estrin, closed_form
+
+DEGREES = [1000, 10000, 100000, 1000000]
+X_VALUES = {  # 各类型自变量的取值，float 取 0.1 避免 x**i 溢出
+    "float": 0.1,
+    "int": 2,
+    "fraction": Fraction(1, 2),
+}
+STRATEGIES = {  # 策略名 -> 以最高次数 d 计算 f(x) 的函数，统一返回 (函数值, 加法次数, 乘法次数)
+    "naive": lambda x, d: naive(x, d, "naive"),
+    "incremental": lambda x, d: naive(x, d, "incremental"),
+    "horner": lambda x, d: horner(x, d + 1),
+    "estrin": lambda x, d: estrin(x, d + 1),
+    "closed": lambda x, d: closed_form(x, d + 1),
+}
+FIELDS = [
+    "strategy", "x_type", "x", "degree", "status", "truncated", "repeats",
+    "median", "min", "max", "stdev", "predicted", "add_times", "mul_times",
+]
+
+
+def measure(func, x, degree: int, warmup: int, repeats: int, budget: float) -> dict:
+    """
+    对单个组合计时
+    :params func: 求值策略
+    :params x: 自变量
+    :params degree: 多项式最高次数
+    :params warmup: 预热次数
+    :params repeats: 正式计时次数
+    :params budget: 单次运行的时间预算（秒），预热超出预算时不再重复，只保留这一次计时并标记为 truncated
+    :return: 一行结果，计时不足两次时 stdev 为 None
+    """
+    timings = []
+    for _ in range(max(warmup, 1)):
+        start = time.perf_counter()
+        _, add_times, mul_times = func(x, degree)
+        elapsed = time.perf_counter() - start
+        if elapsed > budget:
+            break
+    truncated = elapsed > budget
+    if truncated:
+        timings.append(elapsed)  # 太慢的组合不再重复，用预热的那一次作为结果
+    else:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func(x, degree)
+            timings.append(time.perf_counter() - start)
+
+    return {
+        "status": "over_budget" if truncated else "ok",
+        "truncated": truncated,
+        "repeats": len(timings),
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "max": max(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else None,
+        "add_times": add_times,
+        "mul_times": mul_times,
+    }
+
+
+def extrapolate(history: list, degree: int) -> float | None:
+    """
+    由已经计时的次数外推 degree 的单次用时：用最近两个点拟合 t ∝ d^k（k 限制在 [1, 3]），只有一个点时取 k = 1
+    :params history: 已计时的 (次数, 单次用时中位数)，次数从小到大
+    :params degree: 要预测的次数
+    :return: 预测的用时（秒），没有可用的计时时为 None
+    """
+    if not history or history[-1][0] <= 0:
+        return None
+    d1, t1 = history[-1]
+    k = 1.0
+    if len(history) >= 2:
+        d0, t0 = history[-2]
+        if 0 < d0 < d1 and t0 > 0 and t1 > 0:
+            k = min(max(math.log(t1 / t0) / math.log(d1 / d0), 1.0), 3.0)
+    return t1 * (degree / d1) ** k
+
+
+def run(degrees: list, x_types: list, strategies: list, warmup: int = 1, repeats: int = 5, budget: float = 10.0) -> list:
+    """
+    扫描所有组合，次数从小到大；开始下一个次数之前先按 extrapolate 预测用时，超出预算就不再运行，
+    某个 (策略, 类型) 预测或实际超出预算后，更高次数直接记为 skipped
+    :return: 结果行列表
+    """
+    rows = []
+    for strategy in strategies:
+        for x_type in x_types:
+            x = X_VALUES[x_type]
+            exhausted = False
+            history = []
+            for degree in sorted(degrees):
+                row = {"strategy": strategy, "x_type": x_type, "x": str(x), "degree": degree}
+                predicted = extrapolate(history, degree)
+                if exhausted:
+                    row["status"] = "skipped"
+                elif predicted is not None and predicted > budget:
+                    row["status"] = "skipped"
+                    row["predicted"] = predicted
+                    exhausted = True
+                else:
+                    row.update(measure(STRATEGIES[strategy], x, degree, warmup, repeats, budget))
+                    history.append((degree, row["median"]))
+                    exhausted = row["truncated"]
+                rows.append(row)
+                print(
+                    f"{strategy:>12} {x_type:>8} d={degree:<8} {row['status']:>11} {row.get('median', '')}"
+                    + (f" (预测 {predicted:.3g} 秒)" if "predicted" in row else ""),
+                    file=sys.stderr,
+                )
+    return rows
+
+
+def write(rows: list, fmt: str, output) -> None:
+    """
+    输出结果
+    :params rows: 结果行
+    :params fmt: "csv" 或 "json"
+    :params output: 可写的文件对象
+    """
+    if fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        json.dump(
+            {
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "results": rows,
+            },
+            output,
+            ensure_ascii=False,
+            indent=2,
+        )
+        output.write("\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Section1 多项式求值基准测试")
+    parser.add_argument("--degrees", type=int, nargs="+", default=DEGREES, help="多项式最高次数")
+    parser.add_argument("--x-types", nargs="+", default=list(X_VALUES), choices=list(X_VALUES), help="自变量类型")
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES), help="求值策略")
+    parser.add_argument("--warmup", type=int, default=1, help="预热次数")
+    parser.add_argument("--repeats", type=int, default=5, help="计时次数")
+    parser.add_argument("--budget", type=float, default=10.0, help="单次运行的时间预算（秒）")
+    parser.add_argument("--format", choices=["csv", "json"], default="csv", help="输出格式")
+    parser.add_argument("--output", default=None, help="输出文件，默认输出到标准输出")
+    args = parser.parse_args()
+
+    rows = run(args.degrees, args.x_types, args.strategies, args.warmup, args.repeats, args.budget)
+    if args.output is None:
+        write(rows, args.format, sys.stdout)
+    else:
+        with open(args.output, "wt", encoding="utf8", newline="") as f:
+            write(rows, args.format, f)
@@ -1,33 +1,192 @@
+import numpy as np
+
 minus = 2
 LIMIT = 1e-20
+MAX_ITER = 200  # 向量化二分法的迭代上限，float64 区间长度最多减半约 1100 次就到达最小精度，这里远够用
+CHUNK_SIZE = 1_000_000  # 根隔离时每块的采样点数，控制内存占用
 
 
-def f(x):
+def f(x, minus=minus):
     """
-    f = x ** 2 - 2
+    f = x ** 2 - minus
     """
     return x**2 - minus
 
 
-head = float(input("x 区间下限: "))
-tail = float(input("x 区间上限: "))
+def bisect(func, head, tail, *args, limit=LIMIT, max_iter=MAX_ITER) -> tuple:
+    """
+    向量化二分法，同时对 N 个区间求根
+    用掩码只对尚未收敛的区间计算中点，每一步对每个区间只调用一次 func
+    :params func: 目标函数 func(x, *args)，需要支持 NumPy 数组
+    :params head: 区间下限，标量或数组
+    :params tail: 区间上限，标量或数组
+    :params args: 与区间一一对应的参数数组（例如 N 个不同的 minus），会随掩码一起取子集
+    :params limit: 停止条件 (tail - head) ** 2 <= limit
+    :params max_iter: 最大迭代次数
+    :return: (根, 迭代次数)，形状与广播后的区间相同；端点同号的区间根为 nan
+    """
+    head, tail, *args = np.broadcast_arrays(
+        np.asarray(head, dtype=np.float64), np.asarray(tail, dtype=np.float64), *args
+    )
+    shape = head.shape
+    head = head.ravel().copy()
+    tail = tail.ravel().copy()
+    args = [np.ravel(a) for a in args]
+
+    head_sign = np.sign(func(head, *args))  # 端点的符号只算一次
+    tail_sign = np.sign(func(tail, *args))
+    iterations = np.zeros(head.shape, dtype=np.int64)
+    invalid = head_sign * tail_sign > 0  # 端点同号，区间内不保证有根
+    tail[head_sign == 0] = head[head_sign == 0]  # 端点恰好是根时直接收缩区间
+    head[tail_sign == 0] = tail[tail_sign == 0]
+
+    idx = np.flatnonzero(((tail - head) ** 2 > limit) & ~invalid)
+    for _ in range(max_iter):
+        if idx.size == 0:
+            break
+        middle = (head[idx] + tail[idx]) / 2
+        sign = np.sign(func(middle, *(a[idx] for a in args)))
+        iterations[idx] += 1
+
+        right = sign == head_sign[idx]  # 与下限同号，根在右半边
+        head[idx[right]] = middle[right]
+        tail[idx[~right]] = middle[~right]
+        found = sign == 0  # 恰好命中根
+        head[idx[found]] = middle[found]
+
+        idx = idx[(tail[idx] - head[idx]) ** 2 > limit]
+
+    root = (head + tail) / 2
+    root[invalid] = np.nan
+    return root.reshape(shape), iterations.reshape(shape)
+
+
+def chord(func, x0, x1, *args, limit=LIMIT, max_iter=MAX_ITER) -> tuple:
+    """
+    向量化弦截法，同时从 N 对初值出发迭代
+    x2 = x1 - f(x1) * (x1 - x0) / (f(x1) - f(x0))，每一步对每个点只调用一次 func，f(x0) 沿用上一步的 f(x1)
+    :params func: 目标函数 func(x, *args)，需要支持 NumPy 数组
+    :params x0: 第一个初值，标量或数组
+    :params x1: 第二个初值，标量或数组
+    :params args: 与初值一一对应的参数数组
+    :params limit: 停止条件 (x2 - x1) ** 2 <= limit
+    :params max_iter: 最大迭代次数
+    :return: (根, 迭代次数)；出现 f(x1) == f(x0) 或在 max_iter 内没有收敛的点根为 nan
+    """
+    x0, x1, *args = np.broadcast_arrays(
+        np.asarray(x0, dtype=np.float64), np.asarray(x1, dtype=np.float64), *args
+    )
+    shape = x0.shape
+    x0 = x0.ravel().copy()
+    x1 = x1.ravel().copy()
+    args = [np.ravel(a) for a in args]
+
+    f0 = func(x0, *args)
+    f1 = func(x1, *args)
+    iterations = np.zeros(x0.shape, dtype=np.int64)
+    converged = f1 == 0  # 初值恰好是根
+
+    idx = np.flatnonzero(~converged)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iter):
+            if idx.size == 0:
+                break
+            denominator = f1[idx] - f0[idx]
+            x2 = x1[idx] - f1[idx] * (x1[idx] - x0[idx]) / denominator
+            iterations[idx] += 1
+
+            done = (x2 - x1[idx]) ** 2 <= limit
+            converged[idx[done]] = True
+            keep = ~done & (denominator != 0) & np.isfinite(x2)  # 除零或溢出的点直接停止，不再抛出异常
+            x0[idx], f0[idx] = x1[idx], f1[idx]
+            x1[idx] = x2
+            idx = idx[keep]
+            f1[idx] = func(x1[idx], *(a[idx] for a in args))
+
+    x1[~converged] = np.nan
+    return x1.reshape(shape), iterations.reshape(shape)
+
+
+def isolate_roots(func, a: float, b: float, samples: int, chunk_size: int = CHUNK_SIZE):
+    """
+    根隔离：在 [a, b] 上均匀采样 samples 个点，按块计算函数值并找出所有变号区间
+    相邻两块共享边界点，跨块的变号不会漏掉；每次只保留一块的采样值，内存占用与 chunk_size 成正比
+    :params func: 目标函数，需要支持 NumPy 数组
+    :params a: 区间下限
+    :params b: 区间上限
+    :params samples: 采样点总数
+    :params chunk_size: 每块的采样点数
+    :return: 生成器，每块产生一组 (区间下限数组, 区间上限数组)；采样点恰好是根时产生 [x, x]
+    """
+    step = (b - a) / (samples - 1)
+    prev_x = prev_y = None
+    for start in range(0, samples, chunk_size):
+        x = a + step * np.arange(start, min(start + chunk_size, samples))
+        y = func(x)
+        zero = y == 0
+        if prev_x is not None:  # 接上上一块的最后一个点
+            x = np.concatenate(([prev_x], x))
+            y = np.concatenate(([prev_y], y))
+            zero = np.concatenate(([False], zero))
+        change = np.sign(y[:-1]) * np.sign(y[1:]) < 0
+        heads = np.concatenate((x[:-1][change], x[zero]))
+        tails = np.concatenate((x[1:][change], x[zero]))
+        order = np.argsort(heads, kind="stable")
+        yield heads[order], tails[order]
+        prev_x, prev_y = x[-1], y[-1]
+
+
+def find_roots(func, a: float, b: float, samples: int, method: str = "bisect", chunk_size: int = CHUNK_SIZE, **kwargs) -> tuple:
+    """
+    先做根隔离，再把每一块得到的所有区间成批交给求解器
+    :params func: 目标函数，需要支持 NumPy 数组
+    :params a: 区间下限
+    :params b: 区间上限
+    :params samples: 采样点总数
+    :params method: "bisect" 为二分法，"chord" 为以区间两端为初值的弦截法
+    :params chunk_size: 每块的采样点数
+    :params kwargs: 传给求解器的 limit / max_iter
+    :return: (根, 迭代次数)
+    """
+    if method == "bisect":
+        solver = bisect
+    elif method == "chord":
+        solver = chord
+    else:
+        raise ValueError(f"未知的求解方法：{method}")
+
+    roots = []
+    iterations = []
+    for heads, tails in isolate_roots(func, a, b, samples, chunk_size):
+        if heads.size:
+            root, count = solver(func, heads, tails, **kwargs)
+            roots.append(root)
+            iterations.append(count)
+    if not roots:
+        return np.empty(0), np.empty(0, dtype=np.int64)
+    return np.concatenate(roots), np.concatenate(iterations)
 
-itercount = 0
 
 # 制 Markdown 表格提取数据
 # print("""|      |      |      |      |      |
 # | ---- | ---- | ---- | ---- | ---- |""")
 
 if __name__ == "__main__":
+    head = float(input("x 区间下限: "))
+    tail = float(input("x 区间上限: "))
+
+    itercount = 0
+
     while (tail - head) ** 2 > LIMIT:
         middle = (tail + head) / 2
+        value = f(middle)
         itercount += 1
-        print(f"进行 {itercount} 次迭代，下限为 {head}，上限为 {tail}, 此时的中值为 {middle}，f({middle}) {'<' if f(middle) < 0 else '>'} 0")
+        print(f"进行 {itercount} 次迭代，下限为 {head}，上限为 {tail}, 此时的中值为 {middle}，f({middle}) {'<' if value < 0 else '>'} 0")
         # Markdown 表格提取数据
-        # print(f"|{itercount - 1}|{head}|{tail}|{middle}|{'<' if f(middle) < 0 else '>'} 0|")
-        if f(middle) > 0:
+        # print(f"|{itercount - 1}|{head}|{tail}|{middle}|{'<' if value < 0 else '>'} 0|")
+        if value > 0:
             tail = middle
-        elif f(middle) < 0:
+        elif value < 0:
             head = middle
         else:
             print(
@@ -0,0 +1,97 @@
+import math
+import time
+
+from QinJiushao import N
+from Report import report
+
+x = [0.1, 1, 2, 10]
+
+
+def estrin(x, n: int = N) -> tuple:
+    """
+    Estrin 分治法计算 f(x) = 1 + 2x + ... + n x^(n-1)
+    每一层把相邻两项合并成 c[2k] + c[2k+1] * x^(2^level)，再把 x^(2^level) 平方进入下一层，
+    同一层里参与乘法的两个数位数相当，大整数乘法可以用上 Karatsuba，而不是秦九韶算法里
+    "越来越长的累加值 × 很短的 x" 的 O(位数^2) 累积
+    :params x: 自变量，int / Fraction 时为精确运算
+    :params n: 多项式项数
+    :return: (函数值, 加法次数, 乘法次数)
+    """
+    coefficients = list(range(1, n + 1))
+    power = x  # 当前层的 x^(2^level)
+    add_times = 0
+    mul_times = 0
+
+    while len(coefficients) > 1:
+        merged = []
+        for k in range(0, len(coefficients) - 1, 2):
+            merged.append(coefficients[k] + coefficients[k + 1] * power)
+            add_times += 1
+            mul_times += 1
+        if len(coefficients) % 2:  # 奇数项时最后一项直接进入下一层
+            merged.append(coefficients[-1])
+        coefficients = merged
+        if len(coefficients) > 1:
+            power = power * power
+            mul_times += 1
+
+    return coefficients[0], add_times, mul_times
+
+
+def closed_form(x, n: int = N) -> tuple:
+    """
+    利用求和公式计算 f(x) = 1 + 2x + ... + n x^(n-1)
+    f(x) = (1 - (n + 1) x^n + n x^(n+1)) / (1 - x)^2，x = 1 时 f = n(n + 1) / 2
+    只需要一次快速幂，乘法次数为 O(log n)；int 的分子一定能被 (1 - x)^2 整除，所以结果仍是精确的
+    :params x: 自变量
+    :params n: 多项式项数
+    :return: (函数值, 加法次数, 乘法次数)，除法计入乘法次数
+    """
+    if x == 1:
+        return type(x)(n * (n + 1) // 2), 1, 2
+
+    try:
+        x_n = pow(x, n)
+    except OverflowError:  # float 的 pow 溢出时抛出异常，而秦九韶、Estrin 的逐次乘法只会得到 inf
+        x_n = math.inf if x > 0 or n % 2 == 0 else -math.inf
+    mul_times = n.bit_length() - 1 + bin(n).count("1") - 1  # 快速幂：平方次数 + 乘法次数
+    numerator = 1 - (n + 1) * x_n + n * x_n * x
+    one_minus_x = 1 - x
+    denominator = one_minus_x * one_minus_x
+    mul_times += 5  # (n + 1) * x^n、n * x^n、* x、(1 - x)^2、除法
+    add_times = 4  # n + 1、分子两次加减、1 - x
+
+    if isinstance(x, int):
+        return numerator // denominator, add_times, mul_times
+    f = numerator / denominator
+    if isinstance(x, float) and math.isnan(f) and not math.isnan(x):  # 分子中两个 inf 相减，按首项 n x^(n-1) 的符号给出 ±inf
+        f = math.inf if x > 0 or n % 2 == 1 else -math.inf
+    return f, add_times, mul_times
+
+
+def calculate(x, mode: str = "estrin", output: str | None = None) -> None:
+    """
+    精确计算并打印结果，输出格式与 Normal.calculate / QinJiushao.calculate 一致
+    :params x: 自变量
+    :params mode: "estrin" 为分治求值，"closed" 为求和公式
+    :params output: 完整结果的输出文件路径，为 None 时不输出完整的十进制结果
+    :return: None
+    """
+    if mode == "estrin":
+        evaluate = estrin
+    elif mode == "closed":
+        evaluate = closed_form
+    else:
+        raise ValueError(f"未知的计算模式：{mode}")
+
+    start_time = time.time()
+    f, add_times, mul_times = evaluate(x)
+    end_time = time.time()
+
+    report(x, f, add_times, mul_times, end_time - start_time, output)
+
+
+if __name__ == "__main__":
+    for mode in ["estrin", "closed"]:
+        for _ in x:
+            calculate(_, mode)
@@ -1,34 +1,49 @@
 import time
-import sys
 
-sys.set_int_max_str_digits(99999999)    # 设置 int 转 str 的长度限制为 99999999，否则炸ValueError
-# ValueError: Exceeds the limit (4300 digits) for integer string conversion; use sys.set_int_max_str_digits() to increase the limit
+from Report import report
 
 x = [0.1, 1, 2, 10]
+N = 100000  # 多项式最高次数，f(x) = 1 + 2x + 3x^2 + ... + (N + 1) x^N
 
-def calculate(x: int | float) -> None:
+
+def naive(x, n: int = N, mode: str = "naive") -> tuple:
+    """
+    逐项暴力计算 f(x) = 1 + 2x + ... + (n + 1) x^n
+    :params x: 自变量
+    :params n: 多项式最高次数
+    :params mode: "naive" 每一项都从头计算 x**i；"incremental" 维护 x^i，每一项只在上一项的幂上再乘一次 x
+    :return: (函数值, 加法次数, 乘法次数)
+    """
     f = 1
     add_times = 0
     mul_times = 0
 
-    start_time = time.time()
+    if mode == "naive":
+        for i in range(1, n + 1):
+            f += (i + 1) * x**i
+            add_times += 2
+            mul_times += i + 1  # 按教科书的算法，x**i 算作 i 次乘法
+    elif mode == "incremental":
+        power = 1
+        for i in range(1, n + 1):
+            power *= x
+            f += (i + 1) * power
+            add_times += 2
+            mul_times += 2  # 实际只做了 power * x 和 (i + 1) * power 两次乘法
+    else:
+        raise ValueError(f"未知的计算模式：{mode}")
+
+    return f, add_times, mul_times
 
-    for i in range(1, 100001):
-        f += (i + 1) * x**i
-        add_times += 2
-        mul_times += i + 1
 
+def calculate(x: int | float, mode: str = "naive", output: str | None = None) -> None:
+    start_time = time.time()
+    f, add_times, mul_times = naive(x, mode=mode)
     end_time = time.time()
 
-    print("========== calculator output ==========")
-    print(f"x = {x}")
-    print(f"f length = {len(str(f))}")
-    print(f"result = {f}")
-    print(f"add_times = {add_times} times")
-    print(f"mul_times = {mul_times} times")
-    print(f"time used: {round(end_time - start_time, 2)} seconds",)
-    print("")
-    
+    report(x, f, add_times, mul_times, end_time - start_time, output)
+
 if __name__ == "__main__":
-    for _ in x:
-        calculate(_)
+    for mode in ["naive", "incremental"]:
+        for _ in x:
+            calculate(_, mode)
@@ -1,34 +1,81 @@
 import time
-import sys
 
-sys.set_int_max_str_digits(99999999)    # 设置 int 转 str 的长度限制为 99999999，否则炸ValueError
-# ValueError: Exceeds the limit (4300 digits) for integer string conversion; use sys.set_int_max_str_digits() to increase the limit
+import numpy as np
+
+from Report import report
 
 x = [0.1, 1, 2, 10]
+N = 100000  # 多项式项数，f(x) = 1 + 2x + 3x^2 + ... + N x^(N-1)
+
 
-def calculate(x):
+def horner(x, n: int = N) -> tuple:
+    """
+    秦九韶算法计算 f(x) = 1 + 2x + ... + n x^(n-1)
+    :params x: 自变量，int 时为精确的大整数运算
+    :params n: 多项式项数
+    :return: (函数值, 加法次数, 乘法次数)
+    """
     f = 0
     add_times = 0
     mul_times = 0
-    
-    start_time = time.time()
-    
-    for i in range(100000, 0, -1):
+
+    for i in range(n, 0, -1):
         f = f * x + i
         add_times += 1
         mul_times += 1
-        
+
+    return f, add_times, mul_times
+
+
+def calculate(x, output: str | None = None):
+    start_time = time.time()
+    f, add_times, mul_times = horner(x)
     end_time = time.time()
-    
-    print("========== calculator output ==========")
-    print(f"x = {x}")
-    print(f"f length = {len(str(f))}")
-    print(f"result = {f}")
-    print(f"add_times = {add_times} times")
-    print(f"mul_times = {mul_times} times")
-    print(f"time used: {round(end_time - start_time, 2)} seconds",)
-    print("")
+
+    report(x, f, add_times, mul_times, end_time - start_time, output)
+
+
+def calculate_batch(xs, n: int = N, mode: str = "float", verbose: bool = False) -> tuple:
+    """
+    对一组 x 同时用秦九韶算法求值
+    float 模式下每一步 f = f * x + i 都是对整个数组的一次 NumPy 运算，循环只走 n 次而不是 n * len(xs) 次；
+    exact 模式逐点调用 horner，保留 Python 大整数 / Fraction 的精确结果
+    :params xs: 自变量数组，也可以是单个数
+    :params n: 多项式项数
+    :params mode: "float" 为 float64 向量化计算，"exact" 为逐点精确计算
+    :params verbose: 是否像 calculate 一样逐点打印结果
+    :return: (函数值数组, 每个点的加法次数, 每个点的乘法次数)
+    """
+    start_time = time.time()
+
+    if mode == "float":
+        xs = np.atleast_1d(np.asarray(xs, dtype=np.float64))
+        f = np.zeros_like(xs)
+        with np.errstate(over="ignore", invalid="ignore"):  # |x| > 1 时溢出为 inf，与标量 float 的行为一致
+            for i in range(n, 0, -1):
+                np.multiply(f, xs, out=f)
+                np.add(f, i, out=f)
+    elif mode == "exact":
+        xs = np.atleast_1d(np.asarray(xs, dtype=object))  # object 数组保留 int / Fraction，不转成 float64
+        f = np.empty(len(xs), dtype=object)  # 大整数放在 object 数组里，避免被截断成 float64
+        for k, point in enumerate(xs):
+            f[k] = horner(point, n)[0]
+    else:
+        raise ValueError(f"未知的计算模式：{mode}")
+
+    add_times = np.full(len(f), n, dtype=np.int64)  # 秦九韶算法每个点都是 n 次加法、n 次乘法
+    mul_times = np.full(len(f), n, dtype=np.int64)
+
+    end_time = time.time()
+
+    if verbose:
+        for point, value, add, mul in zip(xs, f, add_times, mul_times):
+            report(point, value, add, mul)
+        print(f"time used: {round(end_time - start_time, 2)} seconds ({len(f)} points)")
+
+    return f, add_times, mul_times
+
 
 if __name__ == "__main__":
     for _ in x:
-        calculate(_)    
\ No newline at end of file
+        calculate(_)
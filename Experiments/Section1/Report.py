@@ -0,0 +1,120 @@
+import math
+from fractions import Fraction
+
+LOG10_2 = math.log10(2)
+INLINE_DIGITS = 4000  # 不超过这个位数的整数直接打印，小于 Python 默认的 4300 位转换限制
+CHUNK_DIGITS = 1000  # 写文件时每次 str() 的十进制位数
+
+
+def digit_length(n: int) -> int:
+    """
+    不经过 str() 计算整数的十进制位数
+    由 2^(b-1) <= |n| < 2^b 得到位数的估计值，再和 10 的幂比较一次修正浮点误差带来的 ±1 偏差
+    :params n: 整数
+    :return: 十进制位数（不含负号）
+    """
+    n = abs(n)
+    if n == 0:
+        return 1
+    digits = int((n.bit_length() - 1) * LOG10_2) + 1
+    lower = 10 ** (digits - 1)
+    if n < lower:
+        digits -= 1
+    elif n >= lower * 10:
+        digits += 1
+    return digits
+
+
+def _write_int(file, n: int, chunk_digits: int) -> int:
+    """
+    把整数的十进制表示分块写入已打开的文件，不在内存中拼出完整的字符串
+    按 10^(chunk * 2^k) 递归二分，每个叶子块不超过 chunk_digits 位，无需调大 sys.set_int_max_str_digits
+    :params file: 文本文件对象
+    :params n: 整数
+    :params chunk_digits: 叶子块的位数
+    :return: 写入的十进制位数（不含负号）
+    """
+    powers = [10**chunk_digits]  # powers[k] = 10^(chunk * 2^k)
+    while powers[-1] <= abs(n):
+        powers.append(powers[-1] * powers[-1])
+
+    written = 0
+
+    def _write(value: int, level: int, pad: bool) -> None:
+        nonlocal written
+        if level < 0:
+            s = str(value)
+            if pad:
+                s = s.zfill(chunk_digits)
+            file.write(s)
+            written += len(s)
+            return
+        high, low = divmod(value, powers[level])
+        if high or pad:
+            _write(high, level - 1, pad)
+            _write(low, level - 1, True)
+        else:
+            _write(low, level - 1, False)
+
+    if n < 0:
+        file.write("-")
+    _write(abs(n), len(powers) - 2, False)
+    return written
+
+
+def write_decimal(n, path: str, chunk_digits: int = CHUNK_DIGITS) -> int:
+    """
+    把整数或分数的十进制表示分块写入文件，分数与 str() 一样写成 "分子/分母"
+    :params n: int 或 Fraction
+    :params path: 输出文件路径
+    :params chunk_digits: 叶子块的位数
+    :return: 写入的十进制位数（不含负号与分数线）
+    """
+    with open(path, "wt", encoding="utf8") as f:
+        written = _write_int(f, n.numerator, chunk_digits)  # int 的 numerator 就是它本身
+        if n.denominator != 1:
+            f.write("/")
+            written += _write_int(f, n.denominator, chunk_digits)
+        f.write("\n")
+    return written
+
+
+def report(x, f, add_times: int, mul_times: int, time_used: float | None = None, output: str | None = None) -> None:
+    """
+    打印 calculator output 结果块
+    整数和分数结果只算位数，不转成字符串；位数较少时直接打印，完整结果只在传入 output 时写入文件
+    :params x: 自变量
+    :params f: 函数值
+    :params add_times: 加法次数
+    :params mul_times: 乘法次数
+    :params time_used: 用时（秒），为 None 时不打印
+    :params output: 完整结果的输出文件路径
+    :return: None
+    """
+    print("========== calculator output ==========")
+    print(f"x = {x}")
+    if isinstance(f, (int, Fraction)):
+        if isinstance(f, Fraction):  # 与 str(f) 相同按 "分子/分母" 计数，分母为 1 时只有分子
+            length = digit_length(f.numerator) + (f.denominator != 1) * (1 + digit_length(f.denominator))
+        else:
+            length = digit_length(f)
+        print(f"f length = {length}")
+        if output is not None:
+            write_decimal(f, output)
+            print(f"result = 已写入 {output}")
+        elif length <= INLINE_DIGITS:
+            print(f"result = {f}")
+        else:
+            print(f"result = {length} 位{'分数' if isinstance(f, Fraction) else '整数'}，已省略（传入 output 写入文件）")
+    else:
+        result = str(f)
+        print(f"f length = {len(result)}")
+        print(f"result = {result}")
+        if output is not None:
+            with open(output, "wt", encoding="utf8") as file:
+                file.write(result + "\n")
+    print(f"add_times = {add_times} times")
+    print(f"mul_times = {mul_times} times")
+    if time_used is not None:
+        print(f"time used: {round(time_used, 2)} seconds",)
+    print("")
@@ -0,0 +1,24 @@
+import math
+
+import pytest
+
+from Estrin import closed_form, estrin
+from QinJiushao import horner
+
+
+@pytest.mark.parametrize("x", [0.1, 0.5, -0.5, 1.0, 2.0, -2.0, 1.5, -1.0001])
+@pytest.mark.parametrize("n", [1, 2, 1000, 100000, 100001])
+def test_closed_form_matches_horner_on_float(x, n):
+    expected = horner(x, n)[0]
+    actual = closed_form(x, n)[0]
+    if math.isinf(expected):  # 溢出时两者都给出同号的 inf，closed_form 不应抛出 OverflowError
+        assert actual == expected
+    else:
+        assert actual == pytest.approx(expected, rel=1e-9)
+
+
+@pytest.mark.parametrize("x", [0, 1, 2, 10, -3])
+def test_exact_evaluators_match_horner_on_int(x):
+    expected = horner(x, 500)[0]
+    assert estrin(x, 500)[0] == expected
+    assert closed_form(x, 500)[0] == expected
@@ -0,0 +1,145 @@
+import numpy as np
+
+
+class CSRMatrix:
+    """
+    压缩稀疏行（CSR）格式的矩阵，只保存非零元
+    第 i 行的非零元为 data[indptr[i]:indptr[i + 1]]，所在的列为 indices[indptr[i]:indptr[i + 1]]
+    矩阵向量乘法只遍历非零元，时间和内存都与非零元个数 nnz 成正比，而不是 n^2
+    """
+
+    def __init__(self, data, indices, indptr, shape: tuple) -> None:
+        """
+        :params data: 非零元的值
+        :params indices: 非零元所在的列
+        :params indptr: 每一行在 data 中的起止位置，长度为行数 + 1
+        :params shape: 矩阵形状 (行数, 列数)
+        """
+        self.data = np.asarray(data, dtype=np.float64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = tuple(shape)
+        nonempty = np.diff(self.indptr) > 0
+        self._nonempty = nonempty  # 非空的行，矩阵向量乘法按段求和时用
+        self._starts = self.indptr[:-1][nonempty]
+
+    @classmethod
+    def from_triplets(cls, rows, cols, values, shape: tuple) -> "CSRMatrix":
+        """
+        由 (行, 列, 值) 三元组构造，同一位置出现多次时累加，值为 0 的元素不保存
+        :params rows: 行下标
+        :params cols: 列下标
+        :params values: 元素值
+        :params shape: 矩阵形状
+        :return: CSR 矩阵
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        keys = rows * shape[1] + cols
+        keys, inverse = np.unique(keys, return_inverse=True)  # 按行、列排序并合并重复的位置
+        values = np.bincount(inverse, weights=values, minlength=len(keys))
+        keep = values != 0
+        keys, values = keys[keep], values[keep]
+        rows, cols = np.divmod(keys, shape[1])
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(values, cols, indptr, shape)
+
+    @classmethod
+    def from_dense(cls, A) -> "CSRMatrix":
+        """
+        :params A: 稠密矩阵
+        :return: CSR 矩阵
+        """
+        A = np.asarray(A, dtype=np.float64)
+        rows, cols = np.nonzero(A)
+        return cls.from_triplets(rows, cols, A[rows, cols], A.shape)
+
+    @property
+    def nnz(self) -> int:
+        """
+        非零元个数
+        """
+        return len(self.data)
+
+    def diagonal(self) -> np.ndarray:
+        """
+        :return: 对角线元素，没有保存的位置为 0
+        """
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        on_diagonal = rows == self.indices
+        d = np.zeros(min(self.shape))
+        d[rows[on_diagonal]] = self.data[on_diagonal]
+        return d
+
+    def matvec(self, x, out=None) -> np.ndarray:
+        """
+        矩阵向量乘法 A x，x 也可以是 n*k 矩阵（每列一个向量）
+        先算出每个非零元与对应 x 分量的乘积，再按行分段求和
+        :params x: 向量或矩阵
+        :params out: 可选，结果写入的数组
+        :return: A x
+        """
+        x = np.asarray(x)
+        products = self.data.reshape((-1,) + (1,) * (x.ndim - 1)) * x[self.indices]
+        if out is None:
+            out = np.empty((self.shape[0],) + x.shape[1:], dtype=np.result_type(self.data, x))
+        if self._nonempty.all():
+            np.add.reduceat(products, self._starts, axis=0, out=out)
+        else:  # 空行的和为 0；reduceat 只对非空行的起点求和，每一段恰好是一整行
+            out.fill(0)
+            out[self._nonempty] = np.add.reduceat(products, self._starts, axis=0)
+        return out
+
+    def __matmul__(self, x) -> np.ndarray:
+        return self.matvec(x)
+
+    def toarray(self) -> np.ndarray:
+        """
+        :return: 对应的稠密矩阵
+        """
+        A = np.zeros(self.shape)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        A[rows, self.indices] = self.data
+        return A
+
+    def __repr__(self) -> str:
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+def tridiagonal(lower, diagonal, upper) -> CSRMatrix:
+    """
+    三对角矩阵，与追赶法（Works/Week5/TridiagonalMatrixAlgorithm.py）中的记号一致
+    :params lower: 下对角线 a2, ..., an
+    :params diagonal: 主对角线 d1, ..., dn
+    :params upper: 上对角线 c1, ..., c(n-1)
+    :return: n*n 的 CSR 矩阵
+    """
+    n = len(diagonal)
+    index = np.arange(n)
+    rows = np.concatenate((index[1:], index, index[:-1]))
+    cols = np.concatenate((index[:-1], index, index[1:]))
+    values = np.concatenate((np.broadcast_to(lower, n - 1), diagonal, np.broadcast_to(upper, n - 1)))
+    return CSRMatrix.from_triplets(rows, cols, values, (n, n))
+
+
+def poisson_2d(m: int) -> CSRMatrix:
+    """
+    m*m 网格上二维 Poisson 方程的五点差分矩阵（齐次 Dirichlet 边界），阶数为 m^2
+    每行对角元为 4，上下左右的邻点为 -1；一维情形就是对角元 2、邻点 -1 的三对角矩阵
+    :params m: 每个方向的内部网格点数
+    :return: m^2 * m^2 的 CSR 矩阵
+    """
+    n = m * m
+    index = np.arange(n)
+    i, j = np.divmod(index, m)
+    rows = [index]
+    cols = [index]
+    values = [np.full(n, 4.0)]
+    for di, dj in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        inside = (0 <= i + di) & (i + di < m) & (0 <= j + dj) & (j + dj < m)
+        rows.append(index[inside])
+        cols.append(index[inside] + di * m + dj)
+        values.append(np.full(inside.sum(), -1.0))
+    return CSRMatrix.from_triplets(np.concatenate(rows), np.concatenate(cols), np.concatenate(values), (n, n))
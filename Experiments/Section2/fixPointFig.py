@@ -1,60 +1,261 @@
 # -*- coding: utf-8 -*-
 
+import importlib.util
+import sys
+from pathlib import Path
+
 from matplotlib import pyplot as plt
 import numpy as np
 
-def fixpt(f, x, epsilon=1.0E-5, N=500, store=False):
-    y = f(x)
-    n = 0
-    if store:
-        Values = [(x, y)]
-    while abs(y-x) >= epsilon and n < N:
-        x = f(x)
-        n += 1
-        y = f(x)
-        if store:
-            Values.append((x, y))
+# 与作业 4 共用 Common/FixedPoint.py 中的不动点迭代，按文件路径加载，不修改 sys.path
+if "FixedPoint" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location("FixedPoint", Path(__file__).resolve().parents[2] / "Common" / "FixedPoint.py")
+    sys.modules["FixedPoint"] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(sys.modules["FixedPoint"])
+from FixedPoint import CONVERGED, fixed_point  # noqa: E402
+
+
+def fixpt(f, x, epsilon=1.0E-5, N=500, store=False, trajectory=None, capacity=64):
+    """
+    不动点迭代，迭代过程见 FixedPoint.fixed_point()，这里不开启发散检测，与原来的循环一样一直迭代到收敛或 N 次
+    :param f: 迭代函数
+    :param x: 初值
+    :param epsilon: 停止条件
+    :param N: 最大迭代次数
+    :param store: 是否返回迭代轨迹
+    :param trajectory: 轨迹的存储方式 "full" / "ring" / "none"，见 FixedPoint.Trajectory；默认 store 时为 "full"，否则为 "none"
+    :param capacity: "full" 的初始容量，"ring" 保留的步数
+    :return: store 时为 (最后的 f(x), 轨迹)，轨迹是形状为 (n, 2) 的数组，每一行为 (x, f(x))，"ring" 时只有最近 capacity 步；
+        否则为 (x, 迭代次数, f(x))，不收敛时为提示字符串
+    """
+    if trajectory is None:
+        trajectory = "full" if store else "none"
+    if store and trajectory == "none":
+        raise ValueError("store=True 时需要保存轨迹，trajectory 不能为 \"none\"")
+    run = fixed_point(f, x, tol=epsilon, max_iter_count=N, guard=False, trajectory=trajectory, capacity=capacity)
     if store:
-        return y, Values
-    else:
-        if n >= N:
-            return "No fixed point for given start value"
-        else:
-            return x, n, y
+        return run["fx"], run["trajectory"].points
+    if run["status"] != CONVERGED:
+        return "No fixed point for given start value"
+    return run["x"], run["iterations"], run["fx"]
 
 # define f
 def f(x):
      return ((-58 * x - 3) / (7 * x ** 3 - 13 * x ** 2 - 21 * x - 12)) ** (1 / 2)
 
-# find fixed point
-res, points = fixpt(f, 1.5, store = True)
-print(res, points)
 
-# create mesh for plots
-xx = np.arange(1.2, 1.6, 1e-5)
+def cobweb_segments(points: np.ndarray) -> np.ndarray:
+    """
+    预先算出蛛网图的所有线段
+    :param points: fixpt 保存的轨迹，每一行为 (x, f(x))
+    :return: 形状为 (2n, 2, 2) 的数组，第 2k 条从 (x, x) 到 (x, y)，第 2k+1 条从 (x, y) 到 (y, y)
+    """
+    x, y = points[:, 0], points[:, 1]
+    segments = np.empty((len(points), 2, 2, 2))
+    segments[:, 0, 0] = np.stack((x, x), axis=1)  # 竖线起点 (x, x)
+    segments[:, 0, 1] = np.stack((x, y), axis=1)  # 竖线终点 (x, y)
+    segments[:, 1, 0] = np.stack((x, y), axis=1)  # 横线起点 (x, y)
+    segments[:, 1, 1] = np.stack((y, y), axis=1)  # 横线终点 (y, y)
+    return segments.reshape(-1, 2, 2)
+
+
+def zoom_window(x: float, y: float) -> tuple:
+    """
+    第 k 次迭代的坐标范围：以 (x, y) 为中心，半宽为 |x - y|，迭代越接近不动点范围越小
+    :return: ((x 下限, x 上限), (y 下限, y 上限))
+    """
+    half = abs(x - y) or 1e-12  # 已经到达不动点时给一个很小的范围
+    return (x - half, x + half), (y - half, y + half)
+
+
+class AdaptiveSampler:
+    """
+    自适应采样函数曲线，用于画图
+    先在坐标范围内取一组粗网格，再反复对“中点处函数值与两端连线相差超过 tol 个像素”的小区间二分加密，
+    曲线平坦的地方只留少量点，弯曲或陡峭的地方才加密；定义域边界（一端为 nan）附近同样加密
+    网格点取在 2 的整数次幂步长的倍数上，不同坐标范围（动画的每一帧）采到的点大多重合，求过的值都缓存起来复用
+    """
+
+    def __init__(self, f, tol: float = 0.25, pixels: tuple = (640, 480), initial: int = 32, max_depth: int = 12) -> None:
+        """
+        :param f: 函数，需要支持 NumPy 数组
+        :param tol: 允许的误差（像素）
+        :param pixels: 绘图区域的大小（像素），(宽, 高)
+        :param initial: 粗网格的区间数
+        :param max_depth: 每个粗网格区间最多二分的次数
+        """
+        self.f = f
+        self.tol = tol
+        self.pixels = pixels
+        self.initial = initial
+        self.max_depth = max_depth
+        self.cache = {}  # x -> f(x)
+        self.evaluations = 0  # 实际调用 f 求值的点数
+
+    def evaluate(self, xs: np.ndarray) -> np.ndarray:
+        """
+        求一组点的函数值，缓存中没有的点一次性交给 f 求值
+        """
+        missing = [x for x in xs.tolist() if x not in self.cache]
+        if missing:
+            with np.errstate(invalid="ignore", divide="ignore"):  # 定义域外的点为 nan，画图时自动断开
+                values = self.f(np.array(missing))
+            self.cache.update(zip(missing, np.asarray(values, dtype=np.float64).tolist()))
+            self.evaluations += len(missing)
+        return np.array([self.cache[x] for x in xs.tolist()])
+
+    def sample(self, xlim: tuple, ylim: tuple | None = None) -> tuple:
+        """
+        :param xlim: x 的范围 (下限, 上限)
+        :param ylim: y 的范围，用来把误差换算成像素；不给时取粗网格上函数值的范围
+        :return: (xx, f(xx))，xx 升序
+        """
+        lo, hi = min(xlim), max(xlim)
+        h = 2.0 ** np.floor(np.log2((hi - lo) / self.initial))  # 粗网格步长取 2 的整数次幂
+        xs = np.arange(np.floor(lo / h), np.ceil(hi / h) + 1) * h
+        ys = self.evaluate(xs)
+
+        if ylim is None:
+            finite = ys[np.isfinite(ys)]
+            ylim = (finite.min(), finite.max()) if finite.size else (0, 1)
+        x_pixel = (hi - lo) / self.pixels[0]
+        y_pixel = (abs(ylim[1] - ylim[0]) or 1.0) / self.pixels[1]
+
+        active = np.ones(len(xs) - 1, dtype=bool)  # 需要检查的区间
+        for _ in range(self.max_depth):
+            if not active.any():
+                break
+            left = np.flatnonzero(active)
+            mids = (xs[left] + xs[left + 1]) / 2
+            y_mid = self.evaluate(mids)
+            y_line = (ys[left] + ys[left + 1]) / 2
+            refine = (np.abs(y_mid - y_line) > self.tol * y_pixel) | (np.isnan(y_mid) != np.isnan(y_line))
+            refine &= xs[left + 1] - xs[left] > x_pixel / 4  # 区间已经小于像素，没必要再分
+
+            xs = np.insert(xs, left + 1, mids)
+            ys = np.insert(ys, left + 1, y_mid)
+            flags = np.zeros(len(active), dtype=bool)
+            flags[left] = refine
+            active = np.repeat(flags, np.where(active, 2, 1))  # 检查过的区间分成两半，两半都继续检查或都不再检查
+        return xs, ys
+
+
+def cobweb_frames(ax, f, points: np.ndarray, sampler: AdaptiveSampler | None = None):
+    """
+    在 ax 上创建蛛网图的图形对象，返回逐帧更新的函数
+    所有线段预先算好放在一个 LineCollection 里，每一帧只更新可见线段数、坐标范围、曲线数据和标注文字，不重新创建图形对象；
+    函数曲线按当前坐标范围自适应采样，各帧共用一个采样缓存
+    :param ax: matplotlib 坐标轴
+    :param f: 迭代函数，需要支持 NumPy 数组
+    :param points: fixpt 保存的轨迹
+    :param sampler: 曲线采样器，默认按 f 新建一个 AdaptiveSampler
+    :return: update(k)，画出第 k + 1 次迭代时的画面，返回更新过的图形对象
+    """
+    from matplotlib.collections import LineCollection
+
+    segments = cobweb_segments(points)
+    sampler = sampler or AdaptiveSampler(f)
+    curve, = ax.plot([], [], "b")
+    identity, = ax.plot([], [], "r")
+    lines = LineCollection(segments[:0], colors="g")
+    ax.add_collection(lines)
+    label = ax.annotate("", (0, 0), textcoords="offset points", xytext=(0, 10), ha="center")
+
+    def update(k: int) -> tuple:
+        x, y = points[k]
+        xlim, ylim = zoom_window(x, y)
+        curve.set_data(*sampler.sample(xlim, ylim))
+        identity.set_data(xlim, xlim)
+        lines.set_segments(segments[: 2 * (k + 1)])  # 从 (x, x) 到 (x, y) 再到 (y, y)
+        label.set_text(f"({x}, {y})")
+        label.xy = (x, y)
+        ax.set_xlim(xlim)
+        ax.set_ylim(ylim)
+        ax.set_title(f"不动点迭代法求近似解：第 {k + 1} 次迭代")
+        return curve, identity, lines, label
+
+    return update
+
 
 # 设置中文字体，避免表头中文变成方块
-plt.rcParams['font.sans-serif'] = ['SimHei']
-plt.rcParams['axes.unicode_minus'] = False
-
-# plot function and identity
-plt.plot(xx, f(xx), 'b')
-plt.plot(xx, xx, 'r')
-plt.title("不动点迭代法求近似解")
-
-_ = 1   # 迭代次数标记
-# plot lines
-for x, y in points:
-    plt.title(f"不动点迭代法求近似解：第 {_} 次迭代")
-    plt.plot([x, x], [x, y], 'g')   # 从 (x, x) 划线到 (x, y)
-    plt.annotate(f"({x}, {y})", [x, y], textcoords="offset points", xytext=(0, 10), ha="center")
-    x_offset = x - y
-    y_offset = x - y
-    plt.xlim(x - x_offset, x + x_offset)
-    plt.ylim(y - x_offset, y + x_offset)
-    plt.plot([x, y], [y, y], 'g')   # 从 (x, y) 划线到 (y, y)
-    plt.pause(3)
-    _ += 1
-
-# show result
-plt.show()
+CHINESE_FONT = {"font.sans-serif": ["SimHei", "DejaVu Sans"], "axes.unicode_minus": False}
+
+
+def render_cobweb(f, points: np.ndarray, output: str, fps: float = 1 / 3, dpi: int = 100) -> None:
+    """
+    用 Agg 后端离屏渲染蛛网图动画，不需要显示器，也不经过 pyplot
+    每一帧的坐标范围都在变，blit 省不了重绘，所以直接逐帧写出
+    :param f: 迭代函数，需要支持 NumPy 数组
+    :param points: fixpt 保存的轨迹
+    :param output: 输出路径，.gif 用 Pillow，.mp4 需要 ffmpeg，其他路径视为目录，逐帧保存为 PNG
+    :param fps: 帧率，默认每 3 秒一帧，与原来 plt.pause(3) 的节奏一致
+    :param dpi: 分辨率
+    """
+    from matplotlib import animation, rc_context
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    output = Path(output)
+    suffix = output.suffix.lower()
+    if suffix == ".gif":
+        writer = animation.PillowWriter(fps=fps)
+    elif suffix == ".mp4":
+        if not animation.FFMpegWriter.isAvailable():
+            raise RuntimeError("输出 MP4 需要安装 ffmpeg")
+        writer = animation.FFMpegWriter(fps=fps)
+    else:
+        writer = None
+        output.mkdir(parents=True, exist_ok=True)
+
+    with rc_context(CHINESE_FONT):
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        update = cobweb_frames(fig.add_subplot(), f, points)
+        if writer is None:
+            for k in range(len(points)):
+                update(k)
+                fig.savefig(output / f"frame_{k + 1:04d}.png", dpi=dpi)
+        else:
+            with writer.saving(fig, output, dpi):
+                for k in range(len(points)):
+                    update(k)
+                    writer.grab_frame()
+
+
+def show_cobweb(f, points: np.ndarray, interval: float = 3000):
+    """
+    在窗口中播放蛛网图动画，由 FuncAnimation 的定时器驱动，不阻塞在 plt.pause 上
+    :param f: 迭代函数
+    :param points: fixpt 保存的轨迹
+    :param interval: 每帧间隔（毫秒）
+    :return: FuncAnimation，需要保持引用，否则动画会被回收
+    """
+    from matplotlib import animation
+
+    plt.rcParams.update(CHINESE_FONT)
+    fig, ax = plt.subplots()
+    update = cobweb_frames(ax, f, points)
+    player = animation.FuncAnimation(fig, update, frames=len(points), interval=interval, repeat=False)
+    plt.show()
+    return player
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="不动点迭代法的蛛网图")
+    parser.add_argument("--start", type=float, default=1.5, help="初值")
+    parser.add_argument("--output", default=None, help="输出 .gif / .mp4，或保存 PNG 帧的目录；不给时在窗口中播放")
+    parser.add_argument("--fps", type=float, default=1 / 3, help="输出动画的帧率")
+    parser.add_argument("--trajectory", choices=["full", "ring"], default="full", help="轨迹的存储方式，ring 时只画最近 --capacity 步")
+    parser.add_argument("--capacity", type=int, default=64, help="full 的初始容量，ring 保留的步数")
+    args = parser.parse_args()
+
+    # find fixed point
+    res, points = fixpt(f, args.start, store=True, trajectory=args.trajectory, capacity=args.capacity)
+    print(res, points)
+
+    if args.output is None:
+        show_cobweb(f, points)
+    else:
+        render_cobweb(f, points, args.output, args.fps)
@@ -0,0 +1,236 @@
+"""
+Homework4 迭代方法的收敛域（吸引域）
+对成百万个初值同时做不动点迭代或牛顿迭代：所有初值组成一个 NumPy 数组，每一步对仍在迭代的点做一次向量运算，
+已经收敛或失败的点用下标掩码剔除；溢出、非法值、导数为零都按点记录状态，不依赖 Python 的异常
+初值可以是实数轴上的点，也可以是复平面上的网格
+
+用法：python Basin.py --method newton --iter-func iter1 --re -3 3 --im -3 3 --num 1000 --output basin.npz
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Homework4 import (
+    DEADLINE,
+    MAX_ITER_COUNT,
+    Polynomial,
+    derivative,
+    iter1,
+    iter2,
+    iter3,
+    iter4,
+    iter5,
+)
+
+ITER_FUNCS = {func.__name__: func for func in [iter1, iter2, iter3, iter4, iter5]}
+
+# 每个点的状态码
+CONVERGED = 0  # 收敛
+NOT_CONVERGED = 1  # 在最大迭代次数内没有收敛
+OVERFLOW = 2  # 迭代值溢出为 inf
+INVALID = 3  # 迭代值为 nan，例如实数域里对负数开方
+ZERO_DIVISION = 4  # 牛顿法导数为零
+STATUS_NAMES = {  # 与 Homework4 中各方法的状态字符串一致
+    CONVERGED: "收敛",
+    NOT_CONVERGED: "无法达到精度要求",
+    OVERFLOW: "溢出错误",
+    INVALID: "非法值",
+    ZERO_DIVISION: "除零错误",
+}
+
+
+def _prepare(starts) -> tuple:
+    """
+    把初值转成一维的 float64 / complex128 数组（复制一份，迭代时原地修改）
+    :param starts: 初值数组，任意形状
+    :return: (展平后的初值, 原形状)
+    """
+    starts = np.asarray(starts)
+    dtype = np.complex128 if np.iscomplexobj(starts) else np.float64
+    return starts.astype(dtype).ravel(), starts.shape
+
+
+def _mark_failed(status: np.ndarray, idx: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    记录迭代值不是有限数的点
+    :param status: 状态数组
+    :param idx: 当前仍在迭代的点的下标
+    :param values: 这些点新算出的迭代值
+    :return: 迭代值为有限数的掩码
+    """
+    finite = np.isfinite(values)
+    status[idx[np.isinf(values)]] = OVERFLOW
+    status[idx[np.isnan(values)]] = INVALID
+    return finite
+
+
+def _build_result(method: str, iter_func: callable, x, iterations, status, shape, evaluations: int) -> dict:
+    return {
+        "method": method,
+        "iter_func": iter_func.__name__,
+        "x": x.reshape(shape),
+        "iterations": iterations.reshape(shape),
+        "status": status.reshape(shape),
+        "evaluations": evaluations,
+    }
+
+
+def fixed_point_basin(iter_func: callable, starts, max_iter_count: int = MAX_ITER_COUNT, tol: float = DEADLINE) -> dict:
+    """
+    向量化的不动点迭代，停止条件与 fixed_point_iteration 相同：|x - iter_func(x)| <= tol 时停在 x
+    每一步对每个仍在迭代的点只求一次 iter_func，算出的值既用于停止判断也作为下一步的 x
+    :param iter_func: 迭代函数，需要支持 NumPy 数组
+    :param starts: 初值数组，实数或复数
+    :param max_iter_count: 最大迭代次数
+    :param tol: 停止条件
+
+    :return: {"method", "iter_func", "x", "iterations", "status", "evaluations"}，
+        x / iterations / status 与 starts 形状相同；失败的点 x 为最后一个有限的迭代值，status 见 STATUS_NAMES
+    """
+    x, shape = _prepare(starts)
+    iterations = np.zeros(x.shape, dtype=np.int64)
+    status = np.full(x.shape, NOT_CONVERGED, dtype=np.int8)
+    evaluations = 0
+
+    idx = np.arange(x.size)
+    with np.errstate(all="ignore"):  # 溢出、非法值按点处理，不需要 NumPy 的警告
+        for k in range(max_iter_count + 1):
+            if idx.size == 0:
+                break
+            gx = iter_func(x[idx])
+            evaluations += idx.size
+            finite = _mark_failed(status, idx, gx)
+            converged = finite & (np.abs(x[idx] - gx) <= tol)
+            status[idx[converged]] = CONVERGED
+
+            keep = finite & ~converged
+            idx, gx = idx[keep], gx[keep]
+            if k == max_iter_count:  # 已经迭代了 max_iter_count 次，剩下的点记为不收敛
+                break
+            x[idx] = gx
+            iterations[idx] += 1
+
+    return _build_result("fixed_point_iteration", iter_func, x, iterations, status, shape, evaluations)
+
+
+def newton_basin(
+    iter_func: callable,
+    starts,
+    max_iter_count: int = MAX_ITER_COUNT,
+    tol: float = DEADLINE,
+    method: str = "auto",
+) -> dict:
+    """
+    向量化的牛顿迭代，停止条件与 newton 相同：|x1 - x| < tol 时停在 x1
+    :param iter_func: 迭代函数，需要支持 NumPy 数组
+    :param starts: 初值数组，实数或复数
+    :param max_iter_count: 最大迭代次数
+    :param tol: 停止条件
+    :param method: 求导方式
+        - "auto": Polynomial 用一次秦九韶遍历同时求函数值和导数值，否则用中心差分
+        - "finite_difference": 中心差分，对复数初值同样适用（迭代函数在复平面上解析时）
+        - 其他 derivative() 支持的方式，要求导函数能对数组逐点求值
+
+    :return: 同 fixed_point_basin()，evaluations 为函数值的求值次数（导数值与之一一对应）
+    """
+    if isinstance(iter_func, Polynomial) and method in ("auto", "polynomial"):
+        evaluate = iter_func.value_and_derivative
+    else:
+        diff_func = derivative(iter_func, "finite_difference" if method == "auto" else method)
+        evaluate = lambda x: (iter_func(x), diff_func(x))
+
+    x, shape = _prepare(starts)
+    iterations = np.zeros(x.shape, dtype=np.int64)
+    status = np.full(x.shape, NOT_CONVERGED, dtype=np.int8)
+    evaluations = 0
+
+    idx = np.arange(x.size)
+    with np.errstate(all="ignore"):
+        for _ in range(max_iter_count):
+            if idx.size == 0:
+                break
+            y, dy = evaluate(x[idx])
+            evaluations += idx.size
+            x1 = x[idx] - y / dy
+            zero = dy == 0
+            keep = _mark_failed(status, idx, x1) & ~zero
+            status[idx[zero]] = ZERO_DIVISION  # 导数为零时 x1 也不是有限数，这里覆盖为除零
+            iterations[idx[~zero]] += 1
+
+            converged = keep & (np.abs(x1 - x[idx]) < tol)
+            x[idx[keep]] = x1[keep]
+            status[idx[converged]] = CONVERGED
+            idx = idx[keep & ~converged]
+
+    return _build_result("newton", iter_func, x, iterations, status, shape, evaluations)
+
+
+METHODS = {"fixed_point_iteration": fixed_point_basin, "newton": newton_basin}
+
+
+def basin_map(method: str, iter_func: callable, starts, **kwargs) -> dict:
+    """
+    :param method: "fixed_point_iteration" 或 "newton"
+    :param iter_func: 迭代函数
+    :param starts: 初值数组
+    :param kwargs: 传给对应求解器的 max_iter_count / tol 等参数
+
+    :return: 求解结果，见 fixed_point_basin()
+    """
+    if method not in METHODS:
+        raise ValueError(f"未知的迭代方法：{method}")
+    return METHODS[method](iter_func, starts, **kwargs)
+
+
+def complex_grid(re: tuple, im: tuple, num: int) -> np.ndarray:
+    """
+    复平面上的矩形网格
+    :param re: 实部范围 (下限, 上限)
+    :param im: 虚部范围 (下限, 上限)
+    :param num: 每个方向的点数
+    :return: num × num 的复数数组，行对应虚部、列对应实部，可以直接用 imshow 画
+    """
+    real = np.linspace(re[0], re[1], num)
+    imag = np.linspace(im[0], im[1], num)
+    return real[np.newaxis, :] + 1j * imag[:, np.newaxis]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Homework4 迭代方法的收敛域")
+    parser.add_argument("--method", default="newton", choices=list(METHODS), help="迭代方法")
+    parser.add_argument("--iter-func", default="iter1", choices=list(ITER_FUNCS), help="迭代函数")
+    parser.add_argument("--re", type=float, nargs=2, default=[-3, 3], help="实部（实数轴）范围")
+    parser.add_argument("--im", type=float, nargs=2, default=None, help="虚部范围，不给时只在实数轴上取初值")
+    parser.add_argument("--num", type=int, default=1000, help="每个方向的初值个数")
+    parser.add_argument("--max-iter-count", type=int, default=MAX_ITER_COUNT, help="最大迭代次数")
+    parser.add_argument("--output", default=None, help="把 starts / x / iterations / status 保存为 .npz")
+    args = parser.parse_args()
+
+    if args.im is None:
+        starts = np.linspace(args.re[0], args.re[1], args.num)
+    else:
+        starts = complex_grid(args.re, args.im, args.num)
+
+    begin = time.perf_counter()
+    result = basin_map(args.method, ITER_FUNCS[args.iter_func], starts, max_iter_count=args.max_iter_count)
+    print(f"共 {starts.size} 个初值，函数求值 {result['evaluations']} 次，用时 {time.perf_counter() - begin:.2f} 秒")
+
+    print("| 状态 | 数量 | 平均迭代次数 |")
+    print("| ---- | ---- | ---- |")
+    for code, name in STATUS_NAMES.items():
+        mask = result["status"] == code
+        if mask.any():
+            print(f"| {name} | {mask.sum()} | {result['iterations'][mask].mean():.2f} |")
+
+    roots = np.unique(np.round(result["x"][result["status"] == CONVERGED], 4))  # 收敛到的不同根
+    print(f"收敛到的根：{roots[:20]}")
+
+    if args.output is not None:
+        np.savez_compressed(
+            args.output,
+            starts=starts,
+            x=result["x"],
+            iterations=result["iterations"],
+            status=result["status"],
+        )
@@ -9,7 +9,32 @@ Link: https://github.com/GDUTMeow/2025NumericalAnalysisWorks
 $7x^5 - 13x^4-21x^3-12x^2+58x+3=0, x∈[1,2]$
 其中初值取 x0 = 1.5，并设置停止条件为 | x(n) - x(n-1) | < 1e-5
 """
-from autograd import grad  # 求导工具
+import importlib.util
+import math
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+
+def load_common(name: str):
+    """
+    按文件路径加载仓库根目录 Common/ 下的共用模块并注册到 sys.modules，之后可以照常 import，不修改 sys.path
+    :param name: 模块名
+    :return: 模块
+    """
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, Path(__file__).resolve().parents[2] / "Common" / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+load_common("FixedPoint")
+from FixedPoint import CONVERGED, fixed_point, quiet  # noqa: E402
+from Sink import MarkdownSink  # noqa: E402
 
 DEADLINE = 1e-5  # 终止条件
 MAX_ITER_COUNT = 1000  # 最大迭代次数
@@ -18,35 +43,69 @@ chord_x0 = 2  # 弦截法的初值
 chord_x1 = 1  # 弦截法的初值
 
 
-def f(x):  # 题目给的 f(x)
+class Polynomial:
     """
-    f = 7x^5 - 13x^4-21x^3-12x^2+58x+3
+    以系数数组表示的多项式，系数从高次到低次排列
+    用秦九韶算法求值，对标量和 NumPy 数组都适用；可以像普通的迭代函数一样调用
     """
-    return 7 * x**5 - 13 * x**4 - 21 * x**3 - 12 * x**2 + 58 * x + 3
 
+    def __init__(self, coefficients, name: str = "polynomial") -> None:
+        """
+        :param coefficients: 系数，从高次到低次
+        :param name: 函数名，输出表格时使用
+        """
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self._coefficients = tuple(self.coefficients.tolist())  # 标量求值时用 Python float，避免 NumPy 标量的开销
+        self.__name__ = name
+
+    def __call__(self, x):
+        result = 0.0
+        for c in self._coefficients:
+            result = result * x + c
+        self._check_overflow(x, result)
+        return result
+
+    @staticmethod
+    def _check_overflow(x, result) -> None:
+        """
+        标量 float 乘法溢出时只会得到 inf，这里和 x**5 一样抛出 OverflowError，保持各迭代方法原有的溢出处理
+        """
+        if isinstance(result, float) and math.isinf(result) and not math.isinf(x):
+            raise OverflowError("多项式求值溢出")
+
+    def value_and_derivative(self, x) -> tuple:
+        """
+        一次秦九韶遍历同时求出函数值和导数值
+        :param x: 自变量
+        :return: (p(x), p'(x))
+        """
+        value = 0.0
+        slope = 0.0
+        for c in self._coefficients:
+            slope = slope * x + value
+            value = value * x + c
+        self._check_overflow(x, value)
+        self._check_overflow(x, slope)
+        return value, slope
+
+    def derivative(self) -> "Polynomial":
+        """
+        :return: 导函数对应的多项式
+        """
+        degree = len(self.coefficients) - 1
+        return Polynomial(
+            self.coefficients[:-1] * np.arange(degree, 0, -1), f"{self.__name__}'"
+        )
+
+    def __repr__(self) -> str:
+        return f"Polynomial({self._coefficients}, name={self.__name__!r})"
 
-# 输出到 Markdown 表格的函数，用于处理数据
-def output_with_markdown_table(iter_data: list, table_name: str) -> None:
-    """
-    输出 Markdown 表格
-    :param iter_data: 迭代数据
-    :param table_name: 表格名
 
-    :return: None
-    """
-    with open("Works/Homework4.md", "at", encoding="utf8") as f:
-        f.write("\n\n")  # 区分上层数据
-        f.write(f"## {table_name}\n\n")  # 写入表格的名称，便于区分
-        f.write("| 迭代次数 | x |\n")  # 表头
-        f.write("| ---- | ---- |\n")  # 表头与数据的分隔线
-        for iter_time, x in iter_data:
-            f.write(f"| {iter_time} | {x} |\n")
-        f.write("\n")  # 区分下层数据
+f = Polynomial([7, -13, -21, -12, 58, 3], "f")  # 题目给的 f = 7x^5 - 13x^4-21x^3-12x^2+58x+3
 
 
 ########## 定义迭代函数 ##########
-def iter1(x):
-    return 7 * x**5 - 13 * x**4 - 21 * x**3 - 12 * x**2 + 59 * x + 3
+iter1 = Polynomial([7, -13, -21, -12, 59, 3], "iter1")  # 7x^5 - 13x^4 - 21x^3 - 12x^2 + 59x + 3
 
 
 def iter2(x):
@@ -65,155 +124,276 @@ def iter5(x):
     return ((-58 * x - 3) / (7 * x**3 - 13 * x**2 - 21 * x - 12)) ** (1 / 2)
 
 
+########## 求导 ##########
+@lru_cache(maxsize=None)
+def derivative(func: callable, method: str = "auto") -> callable:
+    """
+    构造 func 的导函数，同一个 (func, method) 只构造一次，之后直接复用
+    :param func: 待求导的函数
+    :param method: 求导方式
+        - "polynomial": func 为 Polynomial 时直接对系数求导
+        - "autograd": 自动微分（需要安装 autograd）
+        - "complex_step": 复步长法 f'(x) ≈ Im f(x + ih) / h，要求 func 对实数 x 给出实数
+        - "finite_difference": 中心差分
+        - "auto": Polynomial 用 polynomial，否则有 autograd 用 autograd，再否则用 complex_step
+
+    :return: 导函数
+    """
+    if method == "auto":
+        if isinstance(func, Polynomial):
+            method = "polynomial"
+        else:
+            try:
+                import autograd  # noqa: F401  只检查是否安装
+                method = "autograd"
+            except ImportError:
+                method = "complex_step"
+
+    if method == "polynomial":
+        return func.derivative()
+    if method == "autograd":
+        from autograd import grad  # 求导工具，只在需要时导入
+
+        return grad(func)
+    if method == "complex_step":
+        return lambda x: func(x + 1e-20j).imag / 1e-20
+    if method == "finite_difference":
+
+        def central_difference(x):
+            h = 6e-6 * np.maximum(1.0, np.abs(x))  # 约为机器精度的立方根；对 NumPy 数组同样适用
+            return (func(x + h) - func(x - h)) / (2 * h)
+
+        return central_difference
+    raise ValueError(f"未知的求导方式：{method}")
+
+
+########## 求值缓存 ##########
+class EvaluationCache:
+    """
+    单次求解内的函数值缓存：同一个点只调用一次迭代函数，并统计实际的求值次数
+    """
+
+    def __init__(self, func: callable) -> None:
+        self.func = func
+        self.values = {}
+        self.count = 0  # 实际调用 func 的次数
+
+    def __call__(self, x):
+        try:
+            return self.values[x]
+        except KeyError:
+            value = self.values[x] = self.func(x)
+            self.count += 1
+            return value
+
+
+########## 求解结果 ##########
+def build_result(method: str, iter_func: callable, start, iter_count: int, iter_data: list, eval_count: int, x=None) -> dict:
+    """
+    汇总一次求解的结构化结果
+    :param method: 迭代方法名
+    :param iter_func: 迭代函数
+    :param start: 初值，双初值的方法为 (x0, x1)
+    :param iter_count: 迭代次数
+    :param iter_data: 迭代数据，最后一行为字符串时表示求解失败的原因
+    :param eval_count: 函数求值次数
+    :param x: 最终的迭代值；表格里记录的不是迭代值本身时（如 Aitken 记录的是 x2）必须传入，
+        不传时取 iter_data 中最后一个有效的值
+
+    :return: {"method", "iter_func", "start", "status", "x", "iterations", "evaluations", "iter_data"}
+    """
+    last = iter_data[-1][1] if iter_data else None
+    status = last if isinstance(last, str) else "收敛"
+    if x is None:
+        x = next((value for _, value in reversed(iter_data) if not isinstance(value, str)), None)
+    return {
+        "method": method,
+        "iter_func": iter_func.__name__,
+        "start": start,
+        "status": status,
+        "x": x,
+        "iterations": iter_count,
+        "evaluations": eval_count,
+        "iter_data": iter_data,
+    }
+
+
 ########## 定义迭代方法 ##########
 # 不动点迭代法
-def fixed_point_iteration(**kwargs) -> None:
+def fixed_point_iteration(**kwargs) -> dict:
     """
-    不动点迭代法
+    不动点迭代法，迭代过程见 FixedPoint.fixed_point()
     :param x: 初值
+    :param max_iter_count: 最大迭代次数，默认为 MAX_ITER_COUNT
     :param iter_func: 迭代函数
+    :param guard: 是否在发散、振荡、收敛太慢时提前停止，默认为 True
+    :param trajectory: 迭代轨迹的存储方式 "full" / "ring" / "none"，见 FixedPoint.Trajectory，默认为 "full"
+    :param verbose: 是否打印迭代过程，默认为 True
 
-    :return: None
+    :return: 求解结果，见 build_result()，另外带有压缩因子估计 contraction、预计剩余迭代次数 remaining 与误差估计 error_bound
     """
-    x: float = kwargs["x"]
     iter_func: callable = kwargs["iter_func"]
-    iter_count = 0  # 初始化迭代次数
-    iter_data = []  # 初始化迭代数据，用于后期输出成 Markdown 表格
-    iter_data.append((iter_count, x))  # 将初值加入迭代数据
-    try:
-        while abs(x - iter_func(x)) > DEADLINE:
-            x = iter_func(x)
-            iter_count += 1
-            iter_data.append((iter_count, x))
-            print(f"进行 {iter_count} 次迭代，此时的 x 为 {x}")
-    except OverflowError:
-        print(f"进行 {iter_count} 次迭代时出现了溢出错误，终止迭代！")
-        iter_data.append((iter_count, "溢出错误"))
-    finally:
-        output_with_markdown_table(iter_data, f"不动点迭代法 {iter_func.__name__}")
+    log = print if kwargs.get("verbose", True) else quiet
+    run = fixed_point(
+        iter_func,
+        kwargs["x"],
+        tol=DEADLINE,
+        max_iter_count=kwargs.get("max_iter_count", MAX_ITER_COUNT),
+        guard=kwargs.get("guard", True),
+        trajectory=kwargs.get("trajectory", "full"),
+        log=log,
+    )
+    iter_count = run["iterations"]
+    trajectory = run["trajectory"]
+    if trajectory.mode == "none":  # 只保留最后的迭代值
+        iter_data = [(iter_count, run["x"])]
+    else:  # 迭代数据随结果返回，由调用方决定输出格式
+        iter_data = list(zip(trajectory.iterations.tolist(), trajectory.x.tolist()))
+    if run["status"] != CONVERGED:
+        log(f"进行 {iter_count} 次迭代后终止迭代：{run['status']}！")
+        iter_data.append((iter_count, run["status"]))
+    result = build_result(
+        "fixed_point_iteration", iter_func, kwargs["x"], iter_count, iter_data, run["evaluations"], x=run["x"]
+    )
+    result.update(contraction=run["contraction"], remaining=run["remaining"], error_bound=run["error_bound"])
+    return result
 
 
 # Aitken 埃特金算法加速的迭代法
-def aitken(**kwargs) -> None:  # 抄 PPT 里面的代码的
+def aitken(**kwargs) -> dict:  # 抄 PPT 里面的代码的
     """
     Aitken 加速的迭代法
     :param x: 初值
     :param max_iter_count: 最大迭代次数
     :param iter_func: 迭代函数
+    :param verbose: 是否打印迭代过程，默认为 True
 
-    :return: None
+    :return: 求解结果，见 build_result()
     """
     x: float = kwargs["x"]
     max_iter_count: int = kwargs["max_iter_count"]
     iter_func: callable = kwargs["iter_func"]
+    log = print if kwargs.get("verbose", True) else quiet
+    evaluate = EvaluationCache(iter_func)  # 停止判断时算过的 iter_func(result) 就是下一轮的 x1，不再重复求值
     iter_count = 0  # 初始化迭代次数
-    iter_data = []  # 初始化迭代数据，用于后期输出成 Markdown 表格
+    iter_data = []  # 初始化迭代数据，随结果返回，由调用方决定输出格式
     found_flag = 0  # 是否找到符合要求的解
+    result = None  # 最近一次的 Aitken 加速值，表格里记录的是 x2，最终结果是它
     try:
         for i in range(max_iter_count):  # 最多迭代 max_iter_count 次
-            x1 = iter_func(x)  # 根据算法要求，获得两个值
-            x2 = iter_func(x1)  # 根据算法要求，获得两个值
+            x1 = evaluate(x)  # 根据算法要求，获得两个值
+            x2 = evaluate(x1)  # 根据算法要求，获得两个值
             iter_count += 1
             iter_data.append((iter_count, x2))  # 将迭代数据加入列表
             if (x2 - 2 * x1 + x) != 0:
                 result = x2 - (x2 - x1) ** 2 / (
                     x2 - 2 * x1 + x
                 )  # 根据 Aitken 算法，通过 x, x1, x2 可以得到一个结果
-                print(f"进行 {iter_count} 次迭代，此时的 x 为 {result}")
+                log(f"进行 {iter_count} 次迭代，此时的 x 为 {result}")
                 if (
-                    abs(result - iter_func(result)) < DEADLINE
+                    abs(result - evaluate(result)) < DEADLINE
                 ):  # 如果结果和迭代函数的差值达到了精度要求，则迭代结束
                     found_flag = 1
                     break
                 else:
                     x = result  # 将结果赋值给 x，进行下一轮迭代
             else:
-                print(
+                log(
                     f"进行 {iter_count} 次迭代时出现了除零错误，Aitken 算法无法使用提供的迭代函数为此函数进行迭代！"
                 )
                 break
         if not found_flag:
-            print(f"经过 {iter_count} 次迭代后，在有限步迭代中无法达到精度要求！")
+            log(f"经过 {iter_count} 次迭代后，在有限步迭代中无法达到精度要求！")
             iter_data.append((iter_count, "无法达到精度要求"))
     except OverflowError:
-        print(f"进行 {iter_count} 次迭代时出现了溢出错误，终止迭代！")
+        log(f"进行 {iter_count} 次迭代时出现了溢出错误，终止迭代！")
         iter_data.append((iter_count, "溢出错误"))
     except ZeroDivisionError:
-        print(f"进行 {iter_count} 次迭代时出现了除零错误，终止迭代！")
+        log(f"进行 {iter_count} 次迭代时出现了除零错误，终止迭代！")
         iter_data.append((iter_count, "除零错误"))
-    finally:
-        output_with_markdown_table(
-            iter_data, f"Aitken 算法加速的迭代法 {iter_func.__name__}"
-        )
+    log(f"共进行了 {evaluate.count} 次函数求值")
+    return build_result("aitken", iter_func, kwargs["x"], iter_count, iter_data, evaluate.count, x=result)
 
 
 # Steffensen 加速的迭代法
-def steffensen(**kwargs) -> None:
+def steffensen(**kwargs) -> dict:
     """
     Steffensen 加速的迭代法
     :param x: 初值
     :param max_iter_count: 最大迭代次数
     :param iter_func: 迭代函数
+    :param verbose: 是否打印迭代过程，默认为 True
 
-    :return: None
+    :return: 求解结果，见 build_result()
     """
     x: float = kwargs["x"]
     max_iter_count: int = kwargs["max_iter_count"]
     iter_func: callable = kwargs["iter_func"]
+    log = print if kwargs.get("verbose", True) else quiet
+    evaluate = EvaluationCache(iter_func)  # 每个点只求一次值，停止判断的 iter_func(result) 留给下一轮使用
     iter_count = 0
     iter_data = []
     found_flag = 0
     for i in range(max_iter_count):  # 最多迭代 max_iter_count 次
-        if iter_func(iter_func(x)) - 2 * iter_func(x) + x != 0:
-            result = x - (iter_func(x) - x) ** 2 / (
-                iter_func(iter_func(x)) - 2 * iter_func(x) + x
-            )
+        y = evaluate(x)
+        z = evaluate(y)
+        if z - 2 * y + x != 0:
+            result = x - (y - x) ** 2 / (z - 2 * y + x)
             iter_count += 1
             iter_data.append((iter_count, result))
-            print(f"进行 {iter_count} 次迭代，此时的 x 为 {result}")
-            if abs(result - iter_func(result)) < DEADLINE:
+            log(f"进行 {iter_count} 次迭代，此时的 x 为 {result}")
+            if abs(result - evaluate(result)) < DEADLINE:
                 found_flag = 1
                 break
             else:
                 x = result
         else:
-            print(
+            log(
                 f"进行 {iter_count} 次迭代时出现了除零错误，Steffensen 算法无法使用提供的迭代函数为此函数进行迭代！"
             )
             iter_data.append((iter_count, "除零错误"))
             break
     if not found_flag:
-        print(f"经过 {iter_count} 次迭代后，在有限步迭代中无法达到精度要求！")
+        log(f"经过 {iter_count} 次迭代后，在有限步迭代中无法达到精度要求！")
         iter_data.append((iter_count, "无法达到精度要求"))
-    output_with_markdown_table(
-        iter_data, f"Steffensen 算法加速的迭代法 {iter_func.__name__}"
-    )
+    log(f"共进行了 {evaluate.count} 次函数求值")
+    return build_result("steffensen", iter_func, kwargs["x"], iter_count, iter_data, evaluate.count)
 
 
 # Newton 牛顿迭代法
-def newton(**kwargs) -> None:
+def newton(**kwargs) -> dict:
     """
     Newton 牛顿迭代法
     :param x: 初值
     :param max_iter_count: 最大迭代次数
     :param iter_func: 迭代函数
+    :param derivative: 求导方式，见 derivative()，默认为 "auto"
+    :param verbose: 是否打印迭代过程，默认为 True
 
-    :return: None
+    :return: 求解结果，见 build_result()
     """
     x: float = kwargs["x"]
     max_iter_count: int = kwargs["max_iter_count"]
     iter_func: callable = kwargs["iter_func"]
+    log = print if kwargs.get("verbose", True) else quiet
+    method = kwargs.get("derivative", "auto")
+    if isinstance(iter_func, Polynomial) and method in ("auto", "polynomial"):
+        evaluate = iter_func.value_and_derivative  # 一次遍历同时得到函数值和导数值
+    else:
+        diff_func = derivative(iter_func, method)  # 导函数只构造一次
+        evaluate = lambda x: (iter_func(x), diff_func(x))
     iter_count = 0
     iter_data = []
     found_flag = 0  # 是否找到符合要求的解
+    eval_count = 0  # 函数值求值次数（导数值与之一一对应）
     for i in range(max_iter_count):
-        y0 = iter_func(x)  # 算出初始 y0
-        dy0 = grad(iter_func)(x)  # 算出初始 dy0（在 x 处的导数值）
+        y0, dy0 = evaluate(x)  # 算出 y0 和 dy0（在 x 处的导数值）
+        eval_count += 1
         if dy0 != 0:  # 牛顿迭代法的条件：导数不为 0
             x1 = x - y0 / dy0
             iter_count += 1
             iter_data.append((iter_count, x1))
-            print(f"进行 {iter_count} 次迭代，此时的 x 为 {x1}")
+            log(f"进行 {iter_count} 次迭代，此时的 x 为 {x1}")
             if abs(x1 - x) < DEADLINE:
                 found_flag = 1
                 break
@@ -222,56 +402,159 @@ def newton(**kwargs) -> None:
         else:
             break
     if not found_flag:
-        print(f"经过 {iter_count} 次迭代后，在有限步迭代中无法达到精度要求！")
+        log(f"经过 {iter_count} 次迭代后，在有限步迭代中无法达到精度要求！")
         iter_data.append((iter_count, "无法达到精度要求"))
-    output_with_markdown_table(iter_data, f"Newton 牛顿迭代法 {iter_func.__name__}")
+    return build_result("newton", iter_func, kwargs["x"], iter_count, iter_data, eval_count)
 
 
 # 弦截法
-def chord_method(**kwargs) -> None:
+def chord_method(**kwargs) -> dict:
     """
     弦截法
     :param x0: 初值
     :param x1: 初值
     :param iter_func: 迭代函数
     :param MAX_ITER_COUNT: 最大迭代次数
+    :param verbose: 是否打印迭代过程，默认为 True
 
-    :return: None
+    :return: 求解结果，见 build_result()
     """
     x0 = kwargs["x0"]
     x1 = kwargs["x1"]
     MAX_ITER_COUNT: int = kwargs["max_iter_count"]
     iter_func: callable = kwargs["iter_func"]
+    log = print if kwargs.get("verbose", True) else quiet
     iter_count = 0
     iter_data = []
+    found_flag = 0
+    eval_count = 0
     try:
+        y0 = iter_func(x0)
+        y1 = iter_func(x1)
+        eval_count = 2
         for i in range(MAX_ITER_COUNT):
-            x2 = x1 - iter_func(x1) * (x1 - x0) / (iter_func(x1) - iter_func(x0))
+            x2 = x1 - y1 * (x1 - x0) / (y1 - y0)
             iter_count += 1
             iter_data.append((iter_count, x2))
             relative_error = abs(x1 - x2)  # 计算相对误差
-            print(f"进行 {iter_count} 次迭代，此时的 x 为 {x2}")
+            log(f"进行 {iter_count} 次迭代，此时的 x 为 {x2}")
             if relative_error < DEADLINE:  # 当相对误差在精度范围内，停止迭代
+                found_flag = 1
                 break
             else:
                 x0, x1 = x1, x2
+                y0, y1 = y1, iter_func(x2)  # 每次迭代只在新点求一次值
+                eval_count += 1
+        if not found_flag:
+            log(f"经过 {iter_count} 次迭代后，在有限步迭代中无法达到精度要求！")
+            iter_data.append((iter_count, "无法达到精度要求"))
     except ZeroDivisionError:
-        print(f"进行 {iter_count} 次迭代时出现了除零错误，终止迭代！")
+        log(f"进行 {iter_count} 次迭代时出现了除零错误，终止迭代！")
         iter_data.append((iter_count, "除零错误"))
-    finally:
-        output_with_markdown_table(iter_data, f"弦截法 {iter_func.__name__}")
+    return build_result("chord_method", iter_func, (kwargs["x0"], kwargs["x1"]), iter_count, iter_data, eval_count)
+
+
+# Brent 混合求根法
+def brent(**kwargs) -> dict:
+    """
+    Brent 混合求根法：始终保持一个变号区间，能用反二次插值或割线步时走超线性的一步，
+    步子不可靠（落在区间外或收缩太慢）时退回二分，因此不会像弦截法那样除零、像牛顿法那样发散
+    :param x0: 区间端点
+    :param x1: 区间端点
+    :param max_iter_count: 最大迭代次数
+    :param iter_func: 迭代函数
+    :param verbose: 是否打印迭代过程，默认为 True
+
+    :return: 求解结果，见 build_result()
+    """
+    a = kwargs["x0"]
+    b = kwargs["x1"]
+    max_iter_count: int = kwargs["max_iter_count"]
+    iter_func: callable = kwargs["iter_func"]
+    log = print if kwargs.get("verbose", True) else quiet
+    iter_count = 0
+    iter_data = []
+    found_flag = 0
+    fa = iter_func(a)
+    fb = iter_func(b)
+    eval_count = 2  # 函数求值次数
+    complex_flag = isinstance(fa, complex) or isinstance(fb, complex)  # 复数无法比较大小，不能判断变号
+    if not complex_flag:
+        if fa * fb > 0:
+            log(f"区间 [{a}, {b}] 两端函数值同号，Brent 算法无法使用提供的迭代函数为此函数进行迭代！")
+            iter_data.append((iter_count, "区间端点同号"))
+        else:
+            c, fc = a, fa
+            d = e = b - a
+            for i in range(max_iter_count):
+                if fb * fc > 0:  # 保证根始终在 b 与 c 之间
+                    c, fc = a, fa
+                    d = e = b - a
+                if abs(fc) < abs(fb):  # 让 b 始终是函数值最小的点
+                    a, b, c = b, c, b
+                    fa, fb, fc = fb, fc, fb
+                tol = 2 * 2.2e-16 * abs(b) + DEADLINE / 2
+                m = (c - b) / 2
+                if abs(m) <= tol or fb == 0:
+                    found_flag = 1
+                    break
+                if abs(e) >= tol and abs(fa) > abs(fb):
+                    s = fb / fa
+                    if a == c:  # 只有两个点，走割线步
+                        p = 2 * m * s
+                        q = 1 - s
+                    else:  # 反二次插值
+                        q = fa / fc
+                        r = fb / fc
+                        p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                        q = (q - 1) * (r - 1) * (s - 1)
+                    if p > 0:
+                        q = -q
+                    else:
+                        p = -p
+                    if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):  # 插值点可信
+                        e = d
+                        d = p / q
+                    else:
+                        d = e = m
+                else:  # 收缩太慢，退回二分
+                    d = e = m
+                a, fa = b, fb
+                b += d if abs(d) > tol else (tol if m > 0 else -tol)
+                fb = iter_func(b)
+                eval_count += 1
+                iter_count += 1
+                iter_data.append((iter_count, b))
+                log(f"进行 {iter_count} 次迭代，此时的 x 为 {b}")
+                if isinstance(fb, complex):
+                    complex_flag = True
+                    break
+            if not found_flag and not complex_flag:
+                log(f"经过 {iter_count} 次迭代后，在有限步迭代中无法达到精度要求！")
+                iter_data.append((iter_count, "无法达到精度要求"))
+    if complex_flag:
+        log(f"进行 {iter_count} 次迭代时函数值出现了复数，终止迭代！")
+        iter_data.append((iter_count, "复数结果"))
+    log(f"共进行了 {eval_count} 次函数求值")
+    return build_result("brent", iter_func, (kwargs["x0"], kwargs["x1"]), iter_count, iter_data, eval_count)
 
 
 if __name__ == "__main__":  # 执行部分
     functions = [fixed_point_iteration, aitken, steffensen, newton, chord_method]
     iters = [iter1, iter2, iter3, iter4, iter5]
-    for func in functions:
-        for iter_func in iters:
-            print(f"正在进行 {func.__name__} 的 {iter_func.__name__} 迭代法")
-            func(
-                x=x0,
-                x0=chord_x0,
-                x1=chord_x1,
-                max_iter_count=MAX_ITER_COUNT,
-                iter_func=iter_func,
-            )
+    with MarkdownSink(Path(__file__).parent / "Homework4.md") as sink:  # 所有表格攒在一起，文件只打开一次
+        for func in functions:
+            for iter_func in iters:
+                print(f"正在进行 {func.__name__} 的 {iter_func.__name__} 迭代法")
+                sink.add(
+                    func(
+                        x=x0,
+                        x0=chord_x0,
+                        x1=chord_x1,
+                        max_iter_count=MAX_ITER_COUNT,
+                        iter_func=iter_func,
+                    )
+                )
+        # Brent 算法求的是 f 的根而不是不动点，与二分法一样需要一个变号区间：f(1) = 22 > 0，f(2) = -81 < 0
+        print("正在进行 brent 的 f 求根")
+        sink.add(brent(x0=1, x1=2, max_iter_count=MAX_ITER_COUNT, iter_func=f))
@@ -0,0 +1,249 @@
+"""
+求解结果的输出
+结果先缓存在内存中，攒够 batch_size 条再一次性写出，文件在整个输出过程中只打开一次；
+支持 Markdown、CSV、JSON Lines，以及列式的 Parquet（需要 pyarrow）与 NPZ
+"""
+import csv
+import json
+import math
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+
+TABLE_TITLES = {  # Markdown 表格标题中的方法名
+    "fixed_point_iteration": "不动点迭代法",
+    "aitken": "Aitken 算法加速的迭代法",
+    "steffensen": "Steffensen 算法加速的迭代法",
+    "newton": "Newton 牛顿迭代法",
+    "chord_method": "弦截法",
+    "brent": "Brent 混合求根法",
+}
+FIELDS = ["method", "iter_func", "start", "status", "x", "iterations", "evaluations", "wall_time"]
+
+
+class ResultSink(ABC):
+    """
+    结果输出的基类，子类实现 _write(rows) 与 _close()
+    可以用 with 语句使用，退出时写出剩余的结果并关闭文件
+    """
+
+    def __init__(self, path, batch_size: int = 1000) -> None:
+        """
+        :param path: 输出文件路径
+        :param batch_size: 缓存多少条结果后写出一次
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.buffer = []
+
+    def add(self, result: dict) -> None:
+        """
+        添加一条求解结果
+        :param result: 迭代方法返回的结果
+        """
+        self.buffer.append(result)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def extend(self, results) -> None:
+        """
+        添加多条求解结果
+        :param results: 结果序列
+        """
+        for result in results:
+            self.add(result)
+
+    def flush(self) -> None:
+        """
+        写出缓存中的结果
+        """
+        if self.buffer:
+            self._write(self.buffer)
+            self.buffer = []
+
+    def close(self) -> None:
+        """
+        写出剩余的结果并关闭文件
+        """
+        self.flush()
+        self._close()
+
+    @abstractmethod
+    def _write(self, rows: list) -> None:
+        """
+        写出一批结果
+        :param rows: 结果列表
+        """
+
+    def _close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class MarkdownSink(ResultSink):
+    """
+    Markdown 表格，与原来 Homework4.md 的格式一致；默认追加写入
+    """
+
+    def __init__(self, path, batch_size: int = 1000, mode: str = "at") -> None:
+        super().__init__(path, batch_size)
+        self.file = open(self.path, mode, encoding="utf8")
+
+    def _write(self, rows: list) -> None:
+        lines = []
+        for result in rows:
+            lines.append("\n\n")  # 区分上层数据
+            lines.append(f"## {TABLE_TITLES.get(result['method'], result['method'])} {result['iter_func']}\n\n")
+            lines.append("| 迭代次数 | x |\n")  # 表头
+            lines.append("| ---- | ---- |\n")  # 表头与数据的分隔线
+            for iter_time, x in result.get("iter_data", []):
+                lines.append(f"| {iter_time} | {x} |\n")
+            if result.get("evaluations") is not None:
+                lines.append(f"\n函数求值次数：{result['evaluations']}\n")
+            lines.append("\n")  # 区分下层数据
+        self.file.write("".join(lines))
+
+    def _close(self) -> None:
+        self.file.close()
+
+
+class CSVSink(ResultSink):
+    """
+    CSV，每条结果一行，不含 iter_data
+    """
+
+    def __init__(self, path, batch_size: int = 1000) -> None:
+        super().__init__(path, batch_size)
+        self.file = open(self.path, "wt", encoding="utf8", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=FIELDS, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def _write(self, rows: list) -> None:
+        self.writer.writerows(rows)
+
+    def _close(self) -> None:
+        self.file.close()
+
+
+class JSONLinesSink(ResultSink):
+    """
+    JSON Lines，每条结果一行；结果带有 iter_data 时一并写出，复数写成字符串
+    """
+
+    def __init__(self, path, batch_size: int = 1000) -> None:
+        super().__init__(path, batch_size)
+        self.file = open(self.path, "wt", encoding="utf8")
+
+    def _write(self, rows: list) -> None:
+        self.file.write(
+            "".join(json.dumps(result, ensure_ascii=False, default=str) + "\n" for result in rows)
+        )
+
+    def _close(self) -> None:
+        self.file.close()
+
+
+def to_columns(rows: list) -> dict:
+    """
+    把结果转成列式的 NumPy 数组
+    双初值的 start 拆成 start 与 start1 两列，缺失的数值记为 nan / -1，x 中有复数时整列为 complex128
+    :param rows: 结果列表
+    :return: 列名 -> 数组
+    """
+    starts = [r["start"] if isinstance(r["start"], tuple) else (r["start"], math.nan) for r in rows]
+    xs = [math.nan if r["x"] is None else r["x"] for r in rows]
+    return {
+        "method": np.array([r["method"] for r in rows]),
+        "iter_func": np.array([r["iter_func"] for r in rows]),
+        "start": np.array([s[0] for s in starts], dtype=np.float64),
+        "start1": np.array([s[1] for s in starts], dtype=np.float64),
+        "status": np.array([r["status"] for r in rows]),
+        "x": np.array(xs, dtype=np.complex128 if any(isinstance(x, complex) for x in xs) else np.float64),
+        "iterations": np.array([-1 if r["iterations"] is None else r["iterations"] for r in rows], dtype=np.int64),
+        "evaluations": np.array([-1 if r["evaluations"] is None else r["evaluations"] for r in rows], dtype=np.int64),
+        "wall_time": np.array([r.get("wall_time", math.nan) for r in rows], dtype=np.float64),
+    }
+
+
+class NPZSink(ResultSink):
+    """
+    NPZ 列式存储；npz 不能追加，各批次的列在关闭时拼接后一次写出
+    """
+
+    def __init__(self, path, batch_size: int = 1000) -> None:
+        super().__init__(path, batch_size)
+        self.chunks = []
+
+    def _write(self, rows: list) -> None:
+        self.chunks.append(to_columns(rows))
+
+    def _close(self) -> None:
+        if not self.chunks:
+            return
+        columns = {}
+        for name in self.chunks[0]:
+            parts = [chunk[name] for chunk in self.chunks]
+            if name == "x":
+                parts = [p.astype(np.result_type(*parts)) for p in parts]  # 某一批出现复数时整列升为复数
+            columns[name] = np.concatenate(parts)
+        np.savez_compressed(self.path, **columns)
+
+
+class ParquetSink(ResultSink):
+    """
+    Parquet 列式存储，每批写成一个 row group（需要安装 pyarrow）；复数 x 拆成 x_real 与 x_imag
+    """
+
+    def __init__(self, path, batch_size: int = 1000) -> None:
+        super().__init__(path, batch_size)
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as e:
+            raise ImportError("输出 Parquet 需要安装 pyarrow：pip install pyarrow") from e
+        self.writer = None
+
+    def _write(self, rows: list) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = to_columns(rows)
+        x = columns.pop("x").astype(np.complex128)
+        columns["x_real"] = x.real
+        columns["x_imag"] = x.imag
+        table = pa.table(columns)
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def _close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+SINKS = {
+    ".md": MarkdownSink,
+    ".csv": CSVSink,
+    ".jsonl": JSONLinesSink,
+    ".npz": NPZSink,
+    ".parquet": ParquetSink,
+}
+
+
+def open_sink(path, batch_size: int = 1000) -> ResultSink:
+    """
+    根据文件后缀选择输出格式
+    :param path: 输出文件路径，后缀为 .md / .csv / .jsonl / .npz / .parquet
+    :param batch_size: 缓存多少条结果后写出一次
+    :return: 对应的 ResultSink
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in SINKS:
+        raise ValueError(f"不支持的输出格式：{suffix}")
+    return SINKS[suffix](path, batch_size)
@@ -0,0 +1,161 @@
+"""
+Homework4 的 迭代方法 × 迭代函数 × 初值 网格扫描
+把每个 (method, iter_func, start) 组合分发到进程池，收集迭代次数、最终 x、状态、求值次数与耗时，
+初值可以有成千上万个，用于绘制收敛域
+
+用法：python Sweep.py --start -3 --stop 3 --num 2000 --processes 8 --output sweep.parquet
+"""
+import argparse
+import os
+import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import product
+
+import numpy as np
+
+from Homework4 import (
+    MAX_ITER_COUNT,
+    aitken,
+    brent,
+    chord_method,
+    chord_x0,
+    chord_x1,
+    f,
+    fixed_point_iteration,
+    iter1,
+    iter2,
+    iter3,
+    iter4,
+    iter5,
+    newton,
+    steffensen,
+)
+from Sink import open_sink
+
+METHODS = {
+    func.__name__: func
+    for func in [fixed_point_iteration, aitken, steffensen, newton, chord_method, brent]
+}
+ITER_FUNCS = {func.__name__: func for func in [iter1, iter2, iter3, iter4, iter5]}
+FUNCS = {**ITER_FUNCS, f.__name__: f}
+ROOT_METHODS = {"brent"}  # 直接求 f 的根而不是迭代函数的不动点，只对 f 扫描，初值对 (x0, x1) 就是搜索区间
+TWO_POINT_METHODS = {"chord_method", "brent"}  # 需要两个初值的方法
+PAIR_OFFSET = chord_x1 - chord_x0  # 只给一个初值 s 时，第二个初值取 s + PAIR_OFFSET，s = chord_x0 时与作业一致
+
+
+def solve_task(task: tuple) -> dict:
+    """
+    在工作进程中求解一个组合，不打印迭代过程
+    :param task: (方法名, 迭代函数名, 初值, 最大迭代次数, 是否保留 iter_data)
+    :return: 求解结果，额外带有 wall_time（秒）
+    """
+    method_name, func_name, start, max_iter_count, keep_iter_data = task
+    kwargs = {
+        "x": start,
+        "max_iter_count": max_iter_count,
+        "iter_func": FUNCS[func_name],
+        "verbose": False,
+        "trajectory": "full" if keep_iter_data else "none",  # 不保留迭代数据时不动点迭代也不保存轨迹
+    }
+    if method_name in TWO_POINT_METHODS:
+        kwargs["x0"], kwargs["x1"] = start if isinstance(start, tuple) else (start, start + PAIR_OFFSET)
+
+    begin = time.perf_counter()
+    try:
+        result = METHODS[method_name](**kwargs)
+    except Exception as e:  # 个别初值会让迭代函数抛出方法内部没有处理的异常，不能让整个扫描中断
+        result = {
+            "method": method_name,
+            "iter_func": func_name,
+            "start": start,
+            "status": f"异常：{type(e).__name__}",
+            "x": None,
+            "iterations": None,
+            "evaluations": None,
+            "iter_data": [],
+        }
+    result["wall_time"] = time.perf_counter() - begin
+    if not keep_iter_data:
+        del result["iter_data"]
+    return result
+
+
+def sweep(
+    methods: list,
+    iter_funcs: list,
+    starts,
+    processes: int | None = None,
+    max_iter_count: int = MAX_ITER_COUNT,
+    keep_iter_data: bool = False,
+    chunksize: int | None = None,
+) -> Iterator[dict]:
+    """
+    扫描 methods × iter_funcs × starts 的所有组合；ROOT_METHODS 中的方法不用迭代函数，只扫描 f × starts
+    结果逐个产出，调用方可以边算边交给 Sink 写出，内存不随组合数增长
+    :param methods: 迭代方法或方法名
+    :param iter_funcs: 迭代函数或函数名
+    :param starts: 初值序列，双初值的方法也可以传入 (x0, x1)
+    :param processes: 进程数，默认为 CPU 核数，为 1 时在当前进程中顺序执行
+    :param max_iter_count: 最大迭代次数
+    :param keep_iter_data: 结果中是否保留完整的迭代数据
+    :param chunksize: 每次分发给工作进程的任务数，默认让每个进程大约分到 8 批
+
+    :return: 结果的迭代器，按方法、函数、初值的顺序排列
+    """
+    starts = [s.item() if isinstance(s, np.generic) else s for s in starts]  # 转成 Python 标量，迭代更快
+    func_names = [getattr(func, "__name__", func) for func in iter_funcs]
+    tasks = []
+    for method in methods:
+        method_name = getattr(method, "__name__", method)
+        targets = [f.__name__] if method_name in ROOT_METHODS else func_names
+        tasks.extend(
+            (method_name, func_name, start, max_iter_count, keep_iter_data)
+            for func_name, start in product(targets, starts)
+        )
+    processes = processes or os.cpu_count()
+    if processes == 1:
+        yield from map(solve_task, tasks)
+        return
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (processes * 8))
+    with ProcessPoolExecutor(processes) as executor:
+        yield from executor.map(solve_task, tasks, chunksize=chunksize)  # 每批结果一到就产出，不等整个网格算完
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Homework4 迭代方法扫描")
+    parser.add_argument("--start", type=float, default=0.5, help="初值下限")
+    parser.add_argument("--stop", type=float, default=2.5, help="初值上限")
+    parser.add_argument("--num", type=int, default=1000, help="初值个数")
+    parser.add_argument("--methods", nargs="+", default=list(METHODS), choices=list(METHODS), help="迭代方法")
+    parser.add_argument("--iter-funcs", nargs="+", default=list(ITER_FUNCS), choices=list(ITER_FUNCS), help="迭代函数")
+    parser.add_argument("--processes", type=int, default=None, help="进程数，默认为 CPU 核数")
+    parser.add_argument("--max-iter-count", type=int, default=MAX_ITER_COUNT, help="最大迭代次数")
+    parser.add_argument("--output", default=None, help="结果文件，按后缀选择格式：.md / .csv / .jsonl / .npz / .parquet")
+    parser.add_argument("--keep-iter-data", action="store_true", help="结果中保留完整的迭代数据（.md / .jsonl 会写出）")
+    args = parser.parse_args()
+
+    begin = time.perf_counter()
+    results = sweep(
+        args.methods,
+        args.iter_funcs,
+        np.linspace(args.start, args.stop, args.num),
+        args.processes,
+        args.max_iter_count,
+        args.keep_iter_data,
+    )
+    summary = Counter()  # 只保留各状态的计数，结果本身写出后即丢弃
+    with open_sink(args.output) if args.output is not None else nullcontext() as sink:
+        for result in results:
+            if sink is not None:
+                sink.add(result)
+            summary[result["method"], result["iter_func"], result["status"]] += 1
+    print(f"共求解 {summary.total()} 个组合，用时 {time.perf_counter() - begin:.2f} 秒")
+
+    print("| 迭代方法 | 迭代函数 | 状态 | 数量 |")
+    print("| ---- | ---- | ---- | ---- |")
+    for (method, func, status), count in sorted(summary.items()):
+        print(f"| {method} | {func} | {status} | {count} |")
@@ -0,0 +1,33 @@
+import pytest
+
+from Homework4 import iter2, iter3, load_common
+
+FixedPoint = load_common("FixedPoint")
+CONVERGED, DIVERGED = FixedPoint.CONVERGED, FixedPoint.DIVERGED
+Trajectory, fixed_point = FixedPoint.Trajectory, FixedPoint.fixed_point
+
+
+@pytest.mark.parametrize(
+    "iter_func, x",
+    [
+        (lambda x: 2 * x, 1.0),  # 增长因子为 2，步长始终不超过 |x|
+        (lambda x: 1.5 * x - 0.5, 1.1),  # 从不动点 1 附近线性远离
+        (lambda x: -2 * x, 1.0),
+    ],
+)
+def test_linear_divergence_stops_early(iter_func, x):
+    result = fixed_point(iter_func, x)
+    assert result["status"] == DIVERGED
+    assert result["iterations"] < 20
+
+
+@pytest.mark.parametrize("iter_func", [iter2, iter3])
+@pytest.mark.parametrize("x", [1.31, 1.4, 1.5])
+def test_leaving_unstable_fixed_point_is_not_divergence(iter_func, x):
+    # 1.3089... 对 iter2、iter3 是不稳定不动点，迭代离开它后收敛到另一个不动点
+    assert fixed_point(iter_func, x)["status"] == fixed_point(iter_func, x, guard=False)["status"] == CONVERGED
+
+
+def test_ring_trajectory_rejects_zero_capacity():
+    with pytest.raises(ValueError):
+        Trajectory("ring", 0)
@@ -0,0 +1,14 @@
+import re
+
+import pytest
+
+from Homework4 import DEADLINE, aitken, iter3, iter4, iter5, x0
+
+
+@pytest.mark.parametrize("iter_func", [iter3, iter4, iter5])
+def test_aitken_returns_last_printed_estimate(iter_func, capsys):
+    result = aitken(x=x0, max_iter_count=1000, iter_func=iter_func)
+    printed = re.findall(r"此时的 x 为 (\S+)", capsys.readouterr().out)
+    assert result["status"] == "收敛"
+    assert result["x"] == float(printed[-1])  # 返回的是通过停止判断的加速值，而不是表格里的 x2
+    assert abs(result["x"] - iter_func(result["x"])) < DEADLINE